@@ -0,0 +1,68 @@
+"""Size vs. decode latency of the cache entry codecs.
+
+Builds synthetic payloads shaped like real cache entries — a 10y/5-term
+interest response and a related response — and times encode_entry /
+decode_entry for every available codec.
+
+    python benchmarks/bench_cache_codecs.py
+"""
+
+import random
+import time
+from datetime import date, timedelta
+
+from trends_cli.api.cache import CODECS, decode_entry, encode_entry
+
+
+def _interest_payload(terms: int, points: int) -> dict:
+    rng = random.Random(0)
+    start = date(2004, 1, 1)
+    raw = {}
+    for t in range(terms):
+        v = 50
+        col = []
+        for i in range(points):
+            v = max(0, min(100, v + rng.randint(-6, 6)))
+            col.append({"date": str(start + timedelta(days=30 * i)), "value": v})
+        raw[f"term {t}"] = col
+    return {"raw": raw, "fetched_at": "2026-01-01T00:00:00", "timeframe": "all", "geo": "US", "_ts": 0.0}
+
+
+def _related_payload(rows: int) -> dict:
+    rng = random.Random(1)
+    words = ["price", "news", "chart", "today", "how to buy", "prediction", "etf", "mining", "wallet", "usd"]
+
+    def _rows(pct: bool) -> list[dict]:
+        return [
+            {"title": f"bitcoin {rng.choice(words)} {rng.choice(words)}",
+             "value": f"{rng.randint(50, 5000)}%" if pct else str(rng.randint(1, 100))}
+            for _ in range(rows)
+        ]
+
+    return {
+        "top_queries": _rows(False), "rising_queries": _rows(True),
+        "top_topics": _rows(False), "rising_topics": _rows(True), "_ts": 0.0,
+    }
+
+
+def _bench(name: str, payload: dict, reps: int = 200) -> None:
+    base = len(encode_entry(payload, "none"))
+    print(f"\n{name}  (plain JSON {base:,} B)")
+    print(f"  {'codec':<6} {'bytes':>9} {'ratio':>7} {'encode µs':>10} {'decode µs':>10}")
+    for codec in ["none", *CODECS]:
+        blob = encode_entry(payload, codec)
+        t0 = time.perf_counter()
+        for _ in range(reps):
+            encode_entry(payload, codec)
+        enc = (time.perf_counter() - t0) / reps * 1e6
+        t0 = time.perf_counter()
+        for _ in range(reps):
+            decode_entry(blob)
+        dec = (time.perf_counter() - t0) / reps * 1e6
+        print(f"  {codec:<6} {len(blob):>9,} {base / len(blob):>6.1f}x {enc:>10.0f} {dec:>10.0f}")
+
+
+if __name__ == "__main__":
+    _bench("interest 10y × 5 terms", _interest_payload(5, 270))
+    _bench("interest 5y × 1 term", _interest_payload(1, 260))
+    _bench("related (4 × 25 rows)", _related_payload(25))
@@ -0,0 +1,52 @@
+"""Min/max column downsampling vs. the previous linear resampling.
+
+For long series (stitched 10y weekly, intraday minute data) the chart has far
+fewer pixel columns than points. This compares, per series length:
+
+- time to turn the series into per-column values
+- time for a full _render_series call
+- whether the drawn peak row matches the series peak (the `Peak:` stat)
+
+    python benchmarks/bench_chart_downsample.py
+"""
+
+import random
+import time
+
+from trends_cli.display.chart import _column_spans, _interp, _render_series, _val_to_px_row
+
+CHAR_W, CHAR_H = 114, 18
+PX_W, PX_H = CHAR_W * 2, CHAR_H * 4
+
+
+def _series(n: int) -> list[float]:
+    rng = random.Random(n)
+    v, out = 30.0, []
+    for _ in range(n):
+        v = max(0.0, min(80.0, v + rng.uniform(-2, 2)))
+        out.append(v)
+    # One-point spike between sample positions of the linear resampler
+    out[n // 3 + 1] = 100.0
+    return out
+
+
+def _time(fn, reps: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(reps):
+        fn()
+    return (time.perf_counter() - t0) / reps * 1000
+
+
+if __name__ == "__main__":
+    peak_row = _val_to_px_row(100.0, PX_H)
+    print(f"{PX_W} px columns\n")
+    print(f"{'points':>8}  {'interp ms':>9}  {'spans ms':>8}  {'render ms':>9}  {'interp peak':>11}  {'spans peak':>10}")
+    for n in (60, 260, 1_000, 10_000, 50_000):
+        values = _series(n)
+        reps = 20 if n <= 10_000 else 5
+        t_interp = _time(lambda: _interp(values, PX_W), reps)
+        t_spans = _time(lambda: _column_spans(values, PX_W), reps)
+        t_render = _time(lambda: _render_series([values], ["green"], CHAR_W, CHAR_H), reps)
+        interp_ok = min(_val_to_px_row(v, PX_H) for v in _interp(values, PX_W)) == peak_row
+        spans_ok = min(_val_to_px_row(hi, PX_H) for _, hi in _column_spans(values, PX_W)) == peak_row
+        print(f"{n:>8,}  {t_interp:>9.2f}  {t_spans:>8.2f}  {t_render:>9.2f}  {str(interp_ok):>11}  {str(spans_ok):>10}")
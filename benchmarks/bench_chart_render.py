@@ -0,0 +1,102 @@
+"""Repeated chart renders: per-row prints vs. one buffered write, cold vs. memoized.
+
+Watch loops and repeated lookups redraw the same cached payload at the same
+terminal width. This renders one search chart repeatedly into an in-memory
+terminal and reports, per render:
+
+- wall time
+- number of write() calls reaching the terminal
+
+for the previous approach (fresh rasterization, one console.print per line),
+the buffered renderer with the raster memo cleared every time, and the
+buffered renderer with the memo warm.
+
+    python benchmarks/bench_chart_render.py
+"""
+
+import io
+import random
+import time
+
+from rich.console import Console
+from rich.text import Text
+
+from trends_cli.display import chart
+from trends_cli.models import DataPoint, TrendSeries
+
+WIDTH = 120
+REPS = 50
+
+
+class _CountingIO(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+
+def _series(n: int) -> TrendSeries:
+    rng = random.Random(n)
+    v, values = 40.0, []
+    for _ in range(n):
+        v = max(0.0, min(100.0, v + rng.uniform(-4, 4)))
+        values.append(int(v))
+    points = [DataPoint(date=f"{2021 + i // 52}-01-01", value=x) for i, x in enumerate(values)]
+    return TrendSeries(
+        query="bitcoin", timeframe="today 5-y", geo="US", fetched_at="",
+        series=points, peak_value=max(values), peak_date=points[values.index(max(values))].date,
+        current_value=values[-1], avg_value=sum(values) / len(values),
+    )
+
+
+def _per_row(series: TrendSeries) -> None:
+    """The pre-buffering renderer: fresh raster, one print per line."""
+    con = chart.console
+    values = [float(dp.value) for dp in series.series]
+    char_w = chart._chart_w()
+    rows = chart._render_series([values], ["green"], char_w, chart._CHART_H)
+    con.print()
+    con.print(chart.Rule("[bold green]TRENDS[/bold green]", style="green dim"))
+    con.print("  [dim]LAST UPDATE[/dim]")
+    con.print()
+    con.print("  [dim]Interest Over Time[/dim]")
+    con.print()
+    y_labels = chart._y_label_rows(chart._CHART_H)
+    for i, row in enumerate(rows):
+        line = Text(y_labels.get(i, "").rjust(chart._Y_AXIS_W) + " ", style="dim")
+        line.append_text(row)
+        con.print(line)
+    con.print(Text(chart._x_label_str([dp.date for dp in series.series], char_w, series.timeframe), style="dim"))
+    con.print()
+    con.print(chart._stats_line(series))
+    con.print("  [dim]* Interest indexed to 100 = peak popularity in window[/dim]")
+    con.print()
+    con.print(chart.Rule(style="green dim"))
+    con.print()
+
+
+def _run(fn, series: TrendSeries, clear_memo: bool) -> tuple[float, float]:
+    out = _CountingIO()
+    chart.console = Console(file=out, width=WIDTH, force_terminal=True, color_system="truecolor")
+    elapsed = 0.0
+    for _ in range(REPS):
+        if clear_memo:
+            chart._raster_cache.clear()
+        t0 = time.perf_counter()
+        fn(series)
+        elapsed += time.perf_counter() - t0
+    return elapsed / REPS * 1000, out.writes / REPS
+
+
+if __name__ == "__main__":
+    print(f"{WIDTH} columns, {REPS} renders each\n")
+    print(f"{'points':>7}  {'per-row ms':>10}  {'writes':>6}  {'cold ms':>7}  {'warm ms':>7}  {'writes':>6}")
+    for n in (60, 260, 520, 5_000):
+        series = _series(n)
+        t_old, w_old = _run(_per_row, series, clear_memo=True)
+        t_cold, _ = _run(chart.render_search_chart, series, clear_memo=True)
+        t_warm, w_new = _run(chart.render_search_chart, series, clear_memo=False)
+        print(f"{n:>7,}  {t_old:>10.2f}  {w_old:>6.0f}  {t_cold:>7.2f}  {t_warm:>7.2f}  {w_new:>6.0f}")
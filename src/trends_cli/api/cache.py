@@ -0,0 +1,540 @@
+"""Response cache: an in-process LRU tier in front of a JSON file cache on disk,
+optionally backed by a shared remote tier (see ``api/remote.py``).
+
+Entries live in ``$TRENDS_CACHE_DIR`` (default ``/tmp/trends_cache``) as
+``{endpoint}-{sha256(key)}.json``. The endpoint prefix and file metadata are
+enough for stats and pruning, so maintenance never has to parse entries —
+only ``verify`` does.
+
+Entries are plain JSON, or a one-line ``TRC1 <codec>`` header followed by the
+compressed JSON. The codec is recorded per entry, so caches written with
+different ``$TRENDS_CACHE_CODEC`` settings stay readable.
+"""
+
+import atexit
+import hashlib
+import json
+import lzma
+import os
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from trends_cli.api.env import env_int, env_warn
+from trends_cli.api.remote import remote_from_env
+
+CACHE_DIR = Path(os.environ.get("TRENDS_CACHE_DIR", "/tmp/trends_cache"))
+CACHE_TTL = env_int("TRENDS_CACHE_TTL", 300)  # 5 minutes by default
+CACHE_MAX_BYTES = env_int("TRENDS_CACHE_MAX_BYTES", 512 * 1024 * 1024)
+
+CACHE_CODEC = os.environ.get("TRENDS_CACHE_CODEC", "none")
+
+_MEM_MAX_ENTRIES = 256
+_MEM_MAX_BYTES = 32 * 1024 * 1024  # approximate, measured as serialized JSON
+
+_remote = remote_from_env()
+
+_STATS_FILE = ".stats.json"
+_ENTRY_SUFFIX = ".json"
+
+# Disk/remote hit/miss counts for this process; folded into _STATS_FILE at exit
+_disk_hits = 0
+_disk_misses = 0
+
+
+def _endpoint(key: str) -> str:
+    """'{"q": ...}' → 'interest', '{"related": ...}' → 'related', etc."""
+    try:
+        first = next(iter(json.loads(key)))
+    except (ValueError, TypeError, StopIteration):
+        return "other"
+    return "interest" if first == "q" else str(first)
+
+
+def cache_path(key: str) -> Path:
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return CACHE_DIR / f"{_endpoint(key)}-{digest}{_ENTRY_SUFFIX}"
+
+
+# ---------------------------------------------------------------------------
+# Entry codecs
+# ---------------------------------------------------------------------------
+
+_HEADER = b"TRC1 "
+
+# name -> (compress, decompress)
+CODECS: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "zlib": (lambda b: zlib.compress(b, 6), zlib.decompress),
+    "lzma": (lambda b: lzma.compress(b, preset=6), lzma.decompress),
+}
+
+try:
+    import zstandard
+
+    CODECS["zstd"] = (
+        lambda b: zstandard.ZstdCompressor(level=3).compress(b),
+        lambda b: zstandard.ZstdDecompressor().decompress(b),
+    )
+except ImportError:
+    pass
+
+if CACHE_CODEC != "none" and CACHE_CODEC not in CODECS:
+    env_warn(
+        f"TRENDS_CACHE_CODEC={CACHE_CODEC!r} is not available "
+        f"(have: none, {', '.join(sorted(CODECS))}); cache entries are written uncompressed"
+    )
+
+
+def register_codec(name: str, compress: Callable[[bytes], bytes], decompress: Callable[[bytes], bytes]) -> None:
+    """Make a codec available for writing (via TRENDS_CACHE_CODEC) and reading."""
+    CODECS[name] = (compress, decompress)
+
+
+class UnknownCodec(Exception):
+    """Entry was written with a codec that is not available in this process."""
+
+
+def encode_entry(data: dict, codec: str = "none") -> bytes:
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    if codec == "none" or codec not in CODECS:
+        return raw
+    return _HEADER + codec.encode() + b"\n" + CODECS[codec][0](raw)
+
+
+def decode_entry(blob: bytes) -> dict:
+    """Inverse of encode_entry. Raises ValueError on corrupt data, UnknownCodec if unreadable here."""
+    if blob.startswith(_HEADER):
+        header, sep, body = blob.partition(b"\n")
+        if not sep:
+            raise ValueError("truncated entry header")
+        codec = header[len(_HEADER):].decode("ascii", "replace")
+        if codec not in CODECS:
+            raise UnknownCodec(codec)
+        try:
+            blob = CODECS[codec][1](body)
+        except Exception as e:
+            raise ValueError(f"{codec} decode failed: {e}") from e
+    data = json.loads(blob)
+    if not isinstance(data, dict):
+        raise ValueError("entry is not an object")
+    return data
+
+
+def cache_read(key: str) -> dict | None:
+    """Return the cached payload for key, or None if missing, expired or corrupt.
+
+    Checks the disk tier, then the remote tier if one is configured; a remote
+    hit is copied to disk. Corrupt disk entries (e.g. from a crashed writer)
+    are removed so they are not re-read as a miss on every call.
+    """
+    global _disk_hits, _disk_misses
+    path = cache_path(key)
+    data = _disk_read(path)
+    if data is None and _remote is not None:
+        data = _remote_fetch([key]).get(key)
+
+    if data is None:
+        _disk_misses += 1
+        return None
+    _disk_hits += 1
+    return data
+
+
+def cache_prefetch(keys: list[str]) -> int:
+    """Copy remote entries for keys that are not fresh on disk, in one round-trip.
+
+    Batch callers (warm, workers, multi-term commands) call this first so
+    their per-key reads stay local. Returns how many entries were pulled.
+    """
+    if _remote is None:
+        return 0
+    now = time.time()
+    missing = []
+    for key in keys:
+        age = cache_age(key)
+        if age is None or age > CACHE_TTL:
+            missing.append(key)
+    return len(_remote_fetch(missing, now))
+
+
+def cache_write(key: str, data: dict) -> None:
+    """Write an entry to disk (and the remote tier, if configured).
+
+    The disk write is atomic: readers see the old file or the new one, never
+    a partial.
+    """
+    data["_ts"] = time.time()
+    blob = encode_entry(data, CACHE_CODEC)
+    path = cache_path(key)
+    _disk_write(path, blob)
+    if _remote is not None:
+        _remote.set_many([(path.name, blob)], CACHE_TTL)
+
+
+def _disk_read(path: Path) -> dict | None:
+    try:
+        with open(path, "rb") as f:
+            data = decode_entry(f.read())
+    except (ValueError, UnicodeDecodeError):
+        path.unlink(missing_ok=True)
+        return None
+    except (UnknownCodec, OSError):
+        return None
+
+    if time.time() - data.get("_ts", 0) > CACHE_TTL:
+        return None
+
+    try:
+        # Keep atime current even on relatime/noatime mounts — prune is LRU by atime
+        os.utime(path, (time.time(), path.stat().st_mtime))
+    except OSError:
+        pass
+    return data
+
+
+def _disk_write(path: Path, blob: bytes, mtime: float | None = None) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            if mtime is not None:
+                # Age is measured from mtime, so keep the original write time
+                os.utime(tmp, (time.time(), mtime))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def _remote_fetch(keys: list[str], now: float | None = None) -> dict[str, dict]:
+    """MGET keys from the remote tier, copy fresh ones to disk, return them decoded."""
+    if _remote is None or not keys:
+        return {}
+    now = time.time() if now is None else now
+    paths = [cache_path(k) for k in keys]
+    found: dict[str, dict] = {}
+    for key, path, blob in zip(keys, paths, _remote.get_many([p.name for p in paths])):
+        if blob is None:
+            continue
+        try:
+            data = decode_entry(blob)
+        except (ValueError, UnicodeDecodeError, UnknownCodec):
+            continue
+        ts = data.get("_ts", 0)
+        if now - ts > CACHE_TTL:
+            continue
+        _disk_write(path, blob, mtime=ts)
+        found[key] = data
+    return found
+
+
+def cache_age(key: str) -> float | None:
+    """Seconds since the entry for key was written, or None if it is missing."""
+    try:
+        return time.time() - cache_path(key).stat().st_mtime
+    except OSError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# In-memory tier
+# ---------------------------------------------------------------------------
+
+class MemoryCache:
+    """In-process LRU tier in front of the disk cache.
+
+    Holds already-decoded results (TrendSeries / RelatedItem lists) so repeat
+    lookups in one process skip the disk read and JSON parse. Bounded by entry
+    count and approximate byte size; entries expire on the same TTL as disk.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        # key -> (ts, size, value)
+        self._entries: OrderedDict[str, tuple[float, int, Any]] = OrderedDict()
+        # Bulk fetches (dashboard, client) read and fill the tier from threads
+        self._lock = threading.RLock()
+
+    def get(self, key: str, max_age: float | None = None) -> Any | None:
+        """The value for key, or None if missing or older than the TTL (or max_age, if shorter)."""
+        ttl = self.ttl if max_age is None else min(self.ttl, max_age)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            ts, _, value = entry
+            if time.time() - ts > ttl:
+                self.invalidate(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any, ts: float, size: int) -> None:
+        with self._lock:
+            self.invalidate(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (ts, size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, old_size, _) = self._entries.popitem(last=False)
+                self._bytes -= old_size
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes":   self._bytes,
+                "hits":    self.hits,
+                "misses":  self.misses,
+            }
+
+
+mem_cache = MemoryCache(_MEM_MAX_ENTRIES, _MEM_MAX_BYTES, CACHE_TTL)
+
+
+# Serialized size of one {"date": ..., "value": ...} point in an interest payload
+_POINT_BYTES = 36
+
+
+def mem_put(key: str, value: Any, payload: dict) -> None:
+    raw = payload.get("raw")
+    if isinstance(raw, dict):
+        # Interest payloads: estimate from the point count instead of
+        # re-serializing, which dominated bulk loads of cached terms
+        size = 64 + _POINT_BYTES * sum(len(col) for col in raw.values())
+    else:
+        size = len(json.dumps(payload))
+    mem_cache.put(key, value, payload.get("_ts", time.time()), size)
+
+
+def memory_cache_stats() -> dict[str, int]:
+    """Entry count, approximate bytes and hit/miss counters of the in-process tier."""
+    return mem_cache.stats()
+
+
+# ---------------------------------------------------------------------------
+# Persistent hit/miss counters
+# ---------------------------------------------------------------------------
+
+def _read_counters() -> dict[str, int]:
+    try:
+        with open(CACHE_DIR / _STATS_FILE) as f:
+            data = json.load(f)
+        return {"hits": int(data.get("hits", 0)), "misses": int(data.get("misses", 0))}
+    except (OSError, ValueError, AttributeError):
+        return {"hits": 0, "misses": 0}
+
+
+@atexit.register
+def _flush_counters() -> None:
+    """Fold this process's disk hit/miss counts into the shared counters file.
+
+    Read-modify-write without locking: concurrent processes can lose a few
+    counts, which is fine for a ratio.
+    """
+    if not (_disk_hits or _disk_misses) or not CACHE_DIR.is_dir():
+        return
+    counters = _read_counters()
+    counters["hits"] += _disk_hits
+    counters["misses"] += _disk_misses
+    try:
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, prefix=".tmp-")
+        with os.fdopen(fd, "w") as f:
+            json.dump(counters, f)
+        os.replace(tmp, CACHE_DIR / _STATS_FILE)
+    except OSError:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Maintenance: stats, prune, verify
+# ---------------------------------------------------------------------------
+
+# Upper bounds (seconds) of the age histogram buckets
+AGE_BUCKETS = [
+    ("<1m",  60),
+    ("<5m",  300),
+    ("<1h",  3600),
+    ("<1d",  86400),
+    ("<7d",  7 * 86400),
+    ("older", float("inf")),
+]
+
+
+@dataclass
+class CacheEntry:
+    path: Path
+    endpoint: str
+    size: int
+    mtime: float
+    atime: float
+
+
+def scan() -> list[CacheEntry]:
+    """List cache entries from directory metadata only (one stat per file)."""
+    entries: list[CacheEntry] = []
+    try:
+        it = os.scandir(CACHE_DIR)
+    except OSError:
+        return entries
+    with it:
+        for de in it:
+            name = de.name
+            if name.startswith(".") or not name.endswith(_ENTRY_SUFFIX):
+                continue
+            try:
+                st = de.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            # Files from before the endpoint prefix have a bare digest name
+            endpoint = name.rsplit("-", 1)[0] if "-" in name else "legacy"
+            entries.append(CacheEntry(Path(de.path), endpoint, st.st_size, st.st_mtime, st.st_atime))
+    return entries
+
+
+def cache_stats() -> dict:
+    """Entry count, bytes, hit ratio and per-endpoint age histogram of the disk cache."""
+    now = time.time()
+    entries = scan()
+    endpoints: dict[str, dict] = {}
+    expired = 0
+
+    for e in entries:
+        age = now - e.mtime
+        if age > CACHE_TTL:
+            expired += 1
+        ep = endpoints.setdefault(
+            e.endpoint,
+            {"entries": 0, "bytes": 0, "ages": {label: 0 for label, _ in AGE_BUCKETS}},
+        )
+        ep["entries"] += 1
+        ep["bytes"] += e.size
+        for label, bound in AGE_BUCKETS:
+            if age < bound:
+                ep["ages"][label] += 1
+                break
+
+    counters = _read_counters()
+    counters["hits"] += _disk_hits
+    counters["misses"] += _disk_misses
+    lookups = counters["hits"] + counters["misses"]
+
+    return {
+        "dir":        str(CACHE_DIR),
+        "entries":    len(entries),
+        "bytes":      sum(e.size for e in entries),
+        "max_bytes":  CACHE_MAX_BYTES,
+        "expired":    expired,
+        "ttl":        CACHE_TTL,
+        "hits":       counters["hits"],
+        "misses":     counters["misses"],
+        "hit_ratio":  round(counters["hits"] / lookups, 3) if lookups else None,
+        "endpoints":  endpoints,
+        "remote":     _remote.stats() if _remote is not None else None,
+    }
+
+
+def prune(max_bytes: int | None = None, dry_run: bool = False) -> dict:
+    """Remove expired entries, then least-recently-used ones until under max_bytes."""
+    budget = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+    now = time.time()
+    entries = scan()
+
+    doomed = [e for e in entries if now - e.mtime > CACHE_TTL]
+    live = [e for e in entries if now - e.mtime <= CACHE_TTL]
+    total = sum(e.size for e in live)
+    if total > budget:
+        live.sort(key=lambda e: e.atime)
+        for e in live:
+            if total <= budget:
+                break
+            doomed.append(e)
+            total -= e.size
+
+    removed_bytes = 0
+    removed = 0
+    for e in doomed:
+        if not dry_run:
+            try:
+                e.path.unlink()
+            except OSError:
+                continue
+        removed += 1
+        removed_bytes += e.size
+
+    if not dry_run:
+        _remove_stale_temp_files(now)
+
+    return {
+        "removed":       removed,
+        "removed_bytes": removed_bytes,
+        "remaining":     len(entries) - removed,
+        "bytes":         sum(e.size for e in entries) - removed_bytes,
+        "dry_run":       dry_run,
+    }
+
+
+def verify(dry_run: bool = False) -> dict:
+    """Parse every entry and remove the ones that are not valid cache payloads."""
+    checked = 0
+    corrupt: list[str] = []
+    for e in scan():
+        checked += 1
+        try:
+            with open(e.path, "rb") as f:
+                data = decode_entry(f.read())
+            ok = isinstance(data.get("_ts"), (int, float))
+        except (ValueError, UnicodeDecodeError):
+            ok = False
+        except (UnknownCodec, OSError):
+            continue
+        if not ok:
+            corrupt.append(e.path.name)
+            if not dry_run:
+                e.path.unlink(missing_ok=True)
+    return {"checked": checked, "corrupt": len(corrupt), "removed": [] if dry_run else corrupt, "dry_run": dry_run}
+
+
+def _remove_stale_temp_files(now: float) -> None:
+    """Temp files older than an hour belong to writers that died mid-write."""
+    try:
+        it = os.scandir(CACHE_DIR)
+    except OSError:
+        return
+    with it:
+        for de in it:
+            if de.name.startswith(".tmp-"):
+                try:
+                    if now - de.stat().st_mtime > 3600:
+                        os.unlink(de.path)
+                except OSError:
+                    pass
@@ -0,0 +1,133 @@
+"""Pairwise correlation and lag correlation across many terms.
+
+Each term is loaded as its own single-term series and placed on the union of
+all terms' dates, NaN where a series has no point. Rows are then centered on
+their observed mean, gaps zeroed and scaled to unit length, so the Pearson
+correlation of every pair is one matrix product. (With gaps this is Pearson
+on mean-imputed series; for the usual case of one timeframe it is exact.)
+
+The product is computed one block of rows at a time against all terms, so
+memory grows with block × terms rather than terms², and top-k or long-format
+output never holds the full matrix. With a lag search, each lag L in
+1…max_lag adds two products per block: rows leading and rows following.
+"""
+
+from typing import Iterator
+
+import numpy as np
+
+from trends_cli.api.trends import TrendsClient, default_client
+from trends_cli.models import Correlation
+
+_BLOCK = 512
+
+
+def load_aligned(
+    queries: list[str],
+    timeframe: str,
+    geo: str,
+    client: TrendsClient | None = None,
+) -> tuple[list[str], list[str], np.ndarray]:
+    """Return (found queries, date grid, terms × dates float32 array).
+
+    Terms that fail or have no data are left out.
+    """
+    client = client or default_client()
+    found = {r.queries[0]: r.value[0] for r in client.interest_many(queries, timeframe, geo) if r.value}
+    names = [q for q in queries if q in found]
+
+    dates = sorted({dp.date for q in names for dp in found[q].series})
+    pos = {d: i for i, d in enumerate(dates)}
+    matrix = np.full((len(names), len(dates)), np.nan, dtype=np.float32)
+    for r, q in enumerate(names):
+        points = found[q].series
+        matrix[r, [pos[dp.date] for dp in points]] = [dp.value for dp in points]
+    return names, dates, matrix
+
+
+def _unit_rows(x: np.ndarray) -> np.ndarray:
+    """Center rows on their observed mean, zero the gaps, scale to unit L2 norm."""
+    mask = ~np.isnan(x)
+    cnt = mask.sum(axis=1, keepdims=True)
+    mean = np.where(mask, x, 0.0).sum(axis=1, keepdims=True) / np.maximum(cnt, 1)
+    z = np.where(mask, x - mean, 0.0).astype(np.float32)
+    norm = np.linalg.norm(z, axis=1, keepdims=True)
+    return np.divide(z, norm, out=np.zeros_like(z), where=norm > 0)
+
+
+def correlate_blocks(
+    matrix: np.ndarray,
+    max_lag: int = 0,
+    rows: list[int] | None = None,
+    block: int = _BLOCK,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield (row indices, corr, lag) for each block of rows against all terms.
+
+    corr[i, j] is the best correlation of rows[i] with term j over lags
+    -max_lag…max_lag, and lag[i, j] the lag it occurs at (> 0: term j follows
+    rows[i]). Ties go to the smaller |lag|. The diagonal is NaN.
+    """
+    n, t = matrix.shape
+    max_lag = max(0, min(max_lag, t - 3))
+    idx_all = np.arange(n) if rows is None else np.asarray(rows, dtype=np.intp)
+
+    unit = _unit_rows(matrix)
+    # Per lag: every row normalized over its leading and its trailing window
+    windows = [(_unit_rows(matrix[:, :t - lag]), _unit_rows(matrix[:, lag:])) for lag in range(1, max_lag + 1)]
+
+    for start in range(0, len(idx_all), block):
+        idx = idx_all[start:start + block]
+        best = unit[idx] @ unit.T
+        best_lag = np.zeros(best.shape, dtype=np.int16)
+        better = np.empty(best.shape, dtype=bool)
+        for lag, (head, tail) in enumerate(windows, 1):
+            for c, signed in ((head[idx] @ tail.T, lag), (tail[idx] @ head.T, -lag)):
+                np.greater(c, best, out=better)
+                np.copyto(best, c, where=better)
+                np.copyto(best_lag, signed, where=better)
+        best[np.arange(len(idx)), idx] = np.nan
+        yield idx, best, best_lag
+
+
+def top_similar(
+    queries: list[str],
+    matrix: np.ndarray,
+    k: int = 10,
+    max_lag: int = 0,
+    targets: list[str] | None = None,
+    min_corr: float = -1.0,
+) -> dict[str, list[Correlation]]:
+    """The k most correlated terms for each target (default: every term)."""
+    n = len(queries)
+    rows = None if targets is None else [queries.index(q) for q in targets]
+    k = max(0, min(k, n - 1))
+    out: dict[str, list[Correlation]] = {}
+    if k == 0:
+        return {queries[i]: [] for i in (rows or range(n))}
+
+    for idx, corr, lag in correlate_blocks(matrix, max_lag, rows):
+        score = np.nan_to_num(corr, nan=-np.inf)
+        part = np.argpartition(-score, k - 1, axis=1)[:, :k]
+        for r, i in enumerate(idx):
+            cols = part[r][np.argsort(-score[r, part[r]], kind="stable")]
+            out[queries[i]] = [
+                Correlation(queries[i], queries[j], round(float(corr[r, j]), 3), int(lag[r, j]))
+                for j in cols
+                if score[r, j] >= min_corr
+            ]
+    return out
+
+
+def iter_pairs(
+    queries: list[str],
+    matrix: np.ndarray,
+    max_lag: int = 0,
+    min_corr: float = -1.0,
+) -> Iterator[Correlation]:
+    """Every unordered pair (i < j) at or above min_corr, streamed block by block."""
+    for idx, corr, lag in correlate_blocks(matrix, max_lag):
+        for r, i in enumerate(idx):
+            row = corr[r, i + 1:]
+            for off in np.flatnonzero(row >= min_corr):
+                j = i + 1 + off
+                yield Correlation(queries[i], queries[j], round(float(row[off]), 3), int(lag[r, j]))
@@ -0,0 +1,36 @@
+"""Settings read from TRENDS_* environment variables.
+
+A bad value must not take down every command (including ``--help``), so it
+is reported once, when the module reading it is imported, and the default
+is used instead.
+"""
+
+import os
+import sys
+
+
+def env_warn(message: str) -> None:
+    """Report a misconfigured setting on stderr without failing."""
+    print(f"trends: warning: {message}", file=sys.stderr)
+
+
+def env_int(name: str, default: int) -> int:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        env_warn(f"ignoring {name}={value!r}: not an integer; using {default}")
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        env_warn(f"ignoring {name}={value!r}: not a number; using {default:g}")
+        return default
@@ -0,0 +1,108 @@
+"""Serve short timeframes by slicing longer cached ones.
+
+`search bitcoin -t 1y` right after `-t 5y` need not hit the network: the 5y
+weekly series already covers the last year at the same resolution. Slicing
+it and re-indexing to the sub-window peak reproduces what Google would
+return, up to integer rounding of the source values.
+
+Only same-granularity sources are used; a coarser source (monthly `all` for
+a weekly `1y`) would lose resolution, so those requests go to the network.
+"""
+
+from datetime import date, timedelta
+
+from trends_cli.api.cache import cache_prefetch
+from trends_cli.api.trends import TrendsClient, default_client, interest_cache_key, series_from_payload
+from trends_cli.models import TrendSeries
+
+# requested timeframe -> (window in days, candidate sources at the same granularity)
+DERIVABLE_FROM: dict[str, tuple[int, list[str]]] = {
+    "today 12-m": (365, ["today 5-y"]),   # weekly
+    "today 1-m":  (30,  ["today 3-m"]),   # daily
+}
+
+# Source values are integers, so rescaling by 100 / peak widens every rounding
+# step to 100 / peak. Below this sub-window peak the derived series is too
+# coarse and the request goes to the network instead.
+MIN_SOURCE_PEAK = 50
+
+
+def fetch_interest_planned(
+    queries: list[str],
+    timeframe: str,
+    geo: str,
+    no_cache: bool = False,
+    client: TrendsClient | None = None,
+) -> list[TrendSeries]:
+    """client.interest, but derive from a cached longer window when possible.
+
+    Follows the client's cache policy: nothing is derived when its cache is
+    off, and sources older than its max_age are ignored.
+
+    Derived series carry `derived_from` set to the source timeframe.
+    """
+    client = client or default_client()
+    if no_cache or not client.cache or timeframe not in DERIVABLE_FROM:
+        return client.interest(queries, timeframe, geo, no_cache)
+
+    window_days, sources = DERIVABLE_FROM[timeframe]
+    exact_key = interest_cache_key(queries, timeframe, geo)
+    source_keys = [interest_cache_key(queries, tf, geo) for tf in sources]
+    # Pull remote-only entries to disk in one round-trip before looking
+    cache_prefetch([exact_key, *source_keys])
+
+    # An exact cached entry always wins over a derived one
+    if client.cached(exact_key) is not None:
+        return client.interest(queries, timeframe, geo)
+
+    for source_key in source_keys:
+        payload = client.cached(source_key)
+        if payload is None:
+            continue
+        derived = derive_payload(payload, timeframe, window_days)
+        if derived is not None:
+            return series_from_payload(queries, derived)
+
+    return client.interest(queries, timeframe, geo)
+
+
+def derive_payload(payload: dict, timeframe: str, window_days: int) -> dict | None:
+    """Slice a cached interest payload to its last `window_days` and re-index to 100.
+
+    All columns are scaled by the same factor, so a compare set stays jointly
+    normalized. Returns None if the source does not cover the whole window,
+    or if its peak inside the window is below MIN_SOURCE_PEAK (too coarse to
+    rescale).
+    """
+    raw = payload.get("raw") or {}
+    if not raw:
+        return None
+
+    try:
+        first_col = next(iter(raw.values()))
+        start = date.fromisoformat(first_col[0]["date"])
+        end = date.fromisoformat(first_col[-1]["date"])
+    except (IndexError, KeyError, ValueError):
+        return None
+
+    cutoff = end - timedelta(days=window_days)
+    if start > cutoff:
+        return None
+    cutoff_s = cutoff.isoformat()
+
+    sliced = {col: [p for p in points if p["date"] > cutoff_s] for col, points in raw.items()}
+    peak = max((p["value"] for points in sliced.values() for p in points), default=0)
+    if peak < MIN_SOURCE_PEAK:
+        return None
+    scale = 100.0 / peak
+
+    return {
+        "raw": {
+            col: [{"date": p["date"], "value": int(round(p["value"] * scale))} for p in points]
+            for col, points in sliced.items()
+        },
+        "fetched_at":   payload.get("fetched_at", ""),
+        "timeframe":    timeframe,
+        "geo":          payload.get("geo", ""),
+        "derived_from": payload.get("timeframe", ""),
+    }
@@ -0,0 +1,230 @@
+"""Egress proxy pool with per-proxy rate budgets and health scoring.
+
+Google rate-limits per source IP, so spreading requests over several egress
+proxies multiplies throughput. Each proxy gets a token bucket (requests per
+minute plus a small burst); requests go to the next proxy round-robin, or to
+the least-loaded one, skipping proxies that are out of tokens or quarantined.
+
+A proxy is quarantined after consecutive failures or when its recent 429 rate
+crosses a threshold. Quarantine doubles on each repeat and resets on the
+first success after release.
+
+Configured from the environment::
+
+    TRENDS_PROXIES="direct,http://10.0.0.2:3128,http://10.0.0.3:3128"
+    TRENDS_PROXY_RATE=20          # requests per minute per proxy
+    TRENDS_PROXY_STRATEGY=least-loaded
+
+``direct`` stands for the host's own IP.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+from trends_cli.api.env import env_float, env_warn
+
+DIRECT = "direct"
+STRATEGIES = ("round-robin", "least-loaded")
+
+_EWMA_ALPHA = 0.2
+_THROTTLE_RATE_LIMIT = 0.5   # ewma 429 rate that triggers quarantine
+_MAX_CONSECUTIVE_FAILURES = 3
+_BASE_QUARANTINE = 60.0
+_MAX_QUARANTINE = 1800.0
+_BURST = 3.0
+
+
+@dataclass
+class ProxyState:
+    url: str
+    rate: float               # tokens per second
+    burst: float
+    tokens: float = 0.0
+    refilled_at: float = field(default_factory=time.monotonic)
+    in_flight: int = 0
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0
+    consecutive_failures: int = 0
+    throttle_ewma: float = 0.0
+    latency_ewma: float = 0.0
+    quarantined_until: float = 0.0
+    quarantine_s: float = _BASE_QUARANTINE
+
+    def __post_init__(self) -> None:
+        self.tokens = self.burst
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+
+    def available(self, now: float) -> bool:
+        return now >= self.quarantined_until and self.tokens >= 1.0
+
+    @property
+    def proxies(self) -> list[str]:
+        """Value for TrendReq(proxies=...)."""
+        return [] if self.url == DIRECT else [self.url]
+
+
+class ProxyPool:
+    def __init__(
+        self,
+        urls: list[str],
+        rate_per_min: float = 20.0,
+        burst: float = _BURST,
+        strategy: str = "round-robin",
+    ) -> None:
+        if not urls:
+            raise ValueError("proxy pool needs at least one proxy")
+        if rate_per_min <= 0:
+            raise ValueError(f"rate_per_min must be positive: {rate_per_min}")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy: {strategy}")
+        self.strategy = strategy
+        self._proxies = [ProxyState(u, rate_per_min / 60.0, burst) for u in urls]
+        self._next = 0
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+
+    def acquire(self, timeout: float | None = None) -> ProxyState:
+        """Block until a proxy has a token to spend and return it.
+
+        Raises TimeoutError if none becomes available within timeout seconds.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                for p in self._proxies:
+                    p.refill(now)
+                proxy = self._pick(now)
+                if proxy is not None:
+                    proxy.tokens -= 1.0
+                    proxy.in_flight += 1
+                    return proxy
+
+                wait = self._next_ready(now) - now
+                if deadline is not None:
+                    if now >= deadline:
+                        raise TimeoutError("no proxy available")
+                    wait = min(wait, deadline - now)
+                self._cond.wait(max(0.01, wait))
+
+    def release(self, proxy: ProxyState, ok: bool, throttled: bool = False, latency: float = 0.0) -> None:
+        """Record the outcome of a request made through proxy."""
+        with self._cond:
+            now = time.monotonic()
+            proxy.in_flight -= 1
+            proxy.requests += 1
+            proxy.throttle_ewma += _EWMA_ALPHA * (float(throttled) - proxy.throttle_ewma)
+            if latency:
+                proxy.latency_ewma = (
+                    latency if not proxy.latency_ewma
+                    else proxy.latency_ewma + _EWMA_ALPHA * (latency - proxy.latency_ewma)
+                )
+
+            if ok:
+                proxy.consecutive_failures = 0
+                proxy.quarantine_s = _BASE_QUARANTINE
+            else:
+                proxy.errors += 1
+                proxy.throttled += int(throttled)
+                proxy.consecutive_failures += 1
+                if (
+                    proxy.consecutive_failures >= _MAX_CONSECUTIVE_FAILURES
+                    or proxy.throttle_ewma >= _THROTTLE_RATE_LIMIT
+                ):
+                    proxy.quarantined_until = now + proxy.quarantine_s
+                    proxy.quarantine_s = min(proxy.quarantine_s * 2, _MAX_QUARANTINE)
+                    proxy.consecutive_failures = 0
+                    proxy.throttle_ewma = 0.0
+            self._cond.notify_all()
+
+    def cancel(self, proxy: ProxyState) -> None:
+        """Hand back a token that was never spent, without recording an outcome."""
+        with self._cond:
+            proxy.in_flight -= 1
+            proxy.tokens = min(proxy.burst, proxy.tokens + 1.0)
+            self._cond.notify_all()
+
+    def abandon(self, proxy: ProxyState) -> None:
+        """Return a proxy whose request the caller gave up on, without recording an outcome.
+
+        Unlike cancel, the token stays spent: the request may have reached Google.
+        """
+        with self._cond:
+            proxy.in_flight -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> list[dict]:
+        with self._lock:
+            now = time.monotonic()
+            return [
+                {
+                    "proxy":         p.url,
+                    "requests":      p.requests,
+                    "errors":        p.errors,
+                    "throttled":     p.throttled,
+                    "throttle_rate": round(p.throttled / p.requests, 3) if p.requests else 0.0,
+                    "latency_ms":    round(p.latency_ewma * 1000),
+                    "in_flight":     p.in_flight,
+                    "quarantined_s": round(max(0.0, p.quarantined_until - now)),
+                }
+                for p in self._proxies
+            ]
+
+    def _pick(self, now: float) -> ProxyState | None:
+        ready = [p for p in self._proxies if p.available(now)]
+        if not ready:
+            return None
+        if self.strategy == "least-loaded":
+            return min(ready, key=lambda p: (p.in_flight, p.latency_ewma))
+        n = len(self._proxies)
+        for i in range(n):
+            p = self._proxies[(self._next + i) % n]
+            if p.available(now):
+                self._next = (self._next + i + 1) % n
+                return p
+        return None
+
+    def _next_ready(self, now: float) -> float:
+        """Earliest time any proxy could be picked again."""
+        times = []
+        for p in self._proxies:
+            t = max(now, p.quarantined_until)
+            if p.tokens < 1.0:
+                t = max(t, now + (1.0 - p.tokens) / p.rate)
+            times.append(t)
+        return min(times)
+
+
+def is_throttled(exc: BaseException) -> bool:
+    """True if exc carries an HTTP 429 response (pytrends TooManyRequestsError / ResponseError)."""
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+def pool_from_env(share: int = 1) -> ProxyPool | None:
+    """The pool described by TRENDS_PROXIES, or None. Bad settings fall back to defaults.
+
+    Token buckets live in one process. When `share` processes on a host use
+    the same proxies, each gets 1/share of the rate and burst so together
+    they stay within the budget.
+    """
+    urls = [u.strip() for u in os.environ.get("TRENDS_PROXIES", "").split(",") if u.strip()]
+    if not urls:
+        return None
+
+    rate = env_float("TRENDS_PROXY_RATE", 20.0)
+    if rate <= 0:
+        env_warn(f"ignoring TRENDS_PROXY_RATE={rate:g}: must be positive; using 20")
+        rate = 20.0
+    strategy = os.environ.get("TRENDS_PROXY_STRATEGY", "").strip() or "round-robin"
+    if strategy not in STRATEGIES:
+        env_warn(f"ignoring TRENDS_PROXY_STRATEGY={strategy!r}: expected {' or '.join(STRATEGIES)}; using round-robin")
+        strategy = "round-robin"
+    share = max(1, share)
+    return ProxyPool(urls, rate_per_min=rate / share, burst=max(1.0, _BURST / share), strategy=strategy)
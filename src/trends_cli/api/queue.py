@@ -0,0 +1,275 @@
+"""Shared SQLite job queue for `trends worker`.
+
+Any number of worker processes — on one host, or on several hosts sharing
+the queue file and cache directory — pull fetch jobs from one table. A claim
+is a lease: a worker that crashes or hangs simply lets it expire and the job
+becomes claimable again, up to `max_attempts` times.
+
+Claims run inside ``BEGIN IMMEDIATE`` so two workers can never take the same
+job. The queue uses SQLite's rollback journal rather than WAL: WAL keeps its
+index in a shared-memory ``-shm`` file, which does not work across hosts on a
+network filesystem. Every transaction is a few row updates, so readers wait
+milliseconds at most.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from trends_cli.api.cache import CACHE_DIR
+from trends_cli.api.proxies import pool_from_env
+from trends_cli.api.trends import TrendsClient
+from trends_cli.api.warm import WarmJob, run_job
+
+QUEUE_PATH = Path(os.environ.get("TRENDS_QUEUE", str(CACHE_DIR / "queue.db")))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id           INTEGER PRIMARY KEY,
+    kind         TEXT    NOT NULL,
+    queries      TEXT    NOT NULL,
+    timeframe    TEXT    NOT NULL,
+    geo          TEXT    NOT NULL,
+    priority     INTEGER NOT NULL DEFAULT 0,
+    state        TEXT    NOT NULL DEFAULT 'pending',
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    lease_until  REAL,
+    worker       TEXT,
+    enqueued_at  REAL    NOT NULL,
+    finished_at  REAL,
+    error        TEXT,
+    UNIQUE (kind, queries, timeframe, geo)
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (state, priority DESC, id);
+"""
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobQueue:
+    def __init__(self, path: Path = QUEUE_PATH, lease_s: float = 120.0, max_attempts: int = 3) -> None:
+        self.path = path
+        self.lease_s = lease_s
+        self.max_attempts = max_attempts
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=DELETE")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def enqueue(self, jobs: list[WarmJob]) -> int:
+        """Add jobs, re-arming finished copies of the same job. Returns rows touched."""
+        now = time.time()
+        rows = [
+            (j.kind, json.dumps(j.queries), j.timeframe, j.geo, j.priority, now)
+            for j in jobs
+        ]
+        with self._tx():
+            before = self._db.total_changes
+            self._db.executemany(
+                """
+                INSERT INTO jobs (kind, queries, timeframe, geo, priority, enqueued_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (kind, queries, timeframe, geo) DO UPDATE SET
+                    state = 'pending', attempts = 0, error = NULL, finished_at = NULL,
+                    priority = excluded.priority, enqueued_at = excluded.enqueued_at
+                WHERE state != 'running'
+                """,
+                rows,
+            )
+            return self._db.total_changes - before
+
+    def claim(self, worker: str) -> tuple[int, WarmJob] | None:
+        """Lease the highest-priority pending (or lease-expired) job."""
+        now = time.time()
+        with self._tx():
+            # Jobs whose lease ran out too many times are given up on
+            self._db.execute(
+                """
+                UPDATE jobs SET state = 'failed', error = 'lease expired', finished_at = ?
+                WHERE state = 'running' AND lease_until < ? AND attempts >= ?
+                """,
+                (now, now, self.max_attempts),
+            )
+            row = self._db.execute(
+                """
+                SELECT id, kind, queries, timeframe, geo, priority FROM jobs
+                WHERE state = 'pending' OR (state = 'running' AND lease_until < ?)
+                ORDER BY priority DESC, id
+                LIMIT 1
+                """,
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            job_id, kind, queries, timeframe, geo, priority = row
+            self._db.execute(
+                """
+                UPDATE jobs SET state = 'running', attempts = attempts + 1,
+                    lease_until = ?, worker = ?
+                WHERE id = ?
+                """,
+                (now + self.lease_s, worker, job_id),
+            )
+        return job_id, WarmJob(kind, json.loads(queries), timeframe, geo, priority)
+
+    # complete / fail / renew only touch a job the worker still holds: once its
+    # lease expired and another worker claimed it, a late call is a no-op
+
+    def complete(self, job_id: int, worker: str) -> bool:
+        """Mark a held job done. False if the lease was lost to another worker."""
+        with self._tx():
+            cur = self._db.execute(
+                """
+                UPDATE jobs SET state = 'done', finished_at = ?, error = NULL
+                WHERE id = ? AND worker = ? AND state = 'running'
+                """,
+                (time.time(), job_id, worker),
+            )
+            return cur.rowcount > 0
+
+    def fail(self, job_id: int, worker: str, error: str) -> bool:
+        """Release a held job after an error: back to pending, or failed once out of attempts."""
+        with self._tx():
+            cur = self._db.execute(
+                """
+                UPDATE jobs SET
+                    state = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    finished_at = CASE WHEN attempts >= ? THEN ? ELSE NULL END,
+                    lease_until = NULL, error = ?
+                WHERE id = ? AND worker = ? AND state = 'running'
+                """,
+                (self.max_attempts, self.max_attempts, time.time(), error[:500], job_id, worker),
+            )
+            return cur.rowcount > 0
+
+    def renew(self, job_id: int, worker: str) -> bool:
+        """Extend a held job's lease by lease_s from now. False if it was lost."""
+        with self._tx():
+            cur = self._db.execute(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND worker = ? AND state = 'running'",
+                (time.time() + self.lease_s, job_id, worker),
+            )
+            return cur.rowcount > 0
+
+    def progress(self, window_s: float = 60.0) -> dict:
+        """Counts by state, throughput over the last window_s seconds, and an ETA."""
+        now = time.time()
+        counts = dict(self._db.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall())
+        recent = self._db.execute(
+            "SELECT COUNT(*) FROM jobs WHERE state = 'done' AND finished_at >= ?",
+            (now - window_s,),
+        ).fetchone()[0]
+        workers = self._db.execute(
+            "SELECT COUNT(DISTINCT worker) FROM jobs WHERE state = 'running' AND lease_until >= ?",
+            (now,),
+        ).fetchone()[0]
+        errors = [
+            {"job": f"{kind} {', '.join(json.loads(q))} [{tf}, {geo or 'WW'}]", "error": err}
+            for kind, q, tf, geo, err in self._db.execute(
+                "SELECT kind, queries, timeframe, geo, error FROM jobs WHERE state = 'failed' LIMIT 10"
+            )
+        ]
+
+        per_min = recent * 60.0 / window_s
+        remaining = counts.get("pending", 0) + counts.get("running", 0)
+        return {
+            "queue":      str(self.path),
+            "total":      sum(counts.values()),
+            "pending":    counts.get("pending", 0),
+            "running":    counts.get("running", 0),
+            "done":       counts.get("done", 0),
+            "failed":     counts.get("failed", 0),
+            "workers":    workers,
+            "per_min":    round(per_min, 1),
+            "eta_s":      round(remaining / per_min * 60) if per_min else None,
+            "errors":     errors,
+        }
+
+    @contextmanager
+    def _tx(self) -> Iterator[None]:
+        """BEGIN IMMEDIATE … COMMIT, rolled back on error."""
+        self._db.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+
+
+def run_worker(
+    queue_path: Path,
+    min_interval: float = 2.0,
+    exit_when_empty: bool = False,
+    poll_s: float = 5.0,
+    processes: int = 1,
+) -> int:
+    """Claim and run jobs until the queue is empty (or forever). Returns jobs completed.
+
+    processes is how many workers on this host share the proxy budget.
+    """
+    queue = JobQueue(queue_path)
+    client = TrendsClient.from_env(pool=pool_from_env(share=processes))
+    me = worker_id()
+    done = 0
+    try:
+        while True:
+            claimed = queue.claim(me)
+            if claimed is None:
+                if exit_when_empty:
+                    return done
+                time.sleep(poll_s)
+                continue
+
+            job_id, job = claimed
+            t0 = time.monotonic()
+            try:
+                with _renewing(queue, job_id, me):
+                    run_job(job, client)
+            except Exception as e:
+                queue.fail(job_id, me, f"{type(e).__name__}: {e}")
+            else:
+                if queue.complete(job_id, me):
+                    done += 1
+            time.sleep(max(0.0, min_interval - (time.monotonic() - t0)))
+    finally:
+        client.close()
+        queue.close()
+
+
+@contextmanager
+def _renewing(queue: JobQueue, job_id: int, worker: str) -> Iterator[None]:
+    """Renew the job's lease every third of its length while the body runs.
+
+    Proxy waits and request retries can outlast one lease; without renewal the
+    job would be claimed and fetched again by a second worker. The renewer
+    uses its own connection, since sqlite3 connections are per-thread.
+    """
+    stop = threading.Event()
+
+    def renew() -> None:
+        q = JobQueue(queue.path, queue.lease_s, queue.max_attempts)
+        try:
+            while not stop.wait(queue.lease_s / 3) and q.renew(job_id, worker):
+                pass
+        finally:
+            q.close()
+
+    t = threading.Thread(target=renew, name=f"lease-{job_id}", daemon=True)
+    t.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        t.join()
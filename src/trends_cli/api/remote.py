@@ -0,0 +1,196 @@
+"""Shared remote cache tier for a fleet of hosts.
+
+The disk cache stays the near tier; a remote key-value store behind it lets
+host B reuse what host A already fetched instead of spending its own per-IP
+rate budget. The only implementation speaks the Redis protocol (RESP2) over a
+plain socket, so no client library is needed and any Redis-compatible server
+(Redis, Valkey, KeyDB, Dragonfly) works::
+
+    TRENDS_CACHE_REMOTE=redis://:password@cache.internal:6379/0
+
+Values are the same encoded entries as on disk (see ``encode_entry``), stored
+with ``SET … EX ttl`` so the server expires them. Bulk reads use one ``MGET``
+and bulk writes one pipelined round-trip.
+
+The remote tier is strictly best-effort: any connection or protocol error
+closes the socket and disables the tier for ``retry_after`` seconds, during
+which reads are misses and writes are dropped.
+"""
+
+import os
+import socket
+import threading
+import time
+from urllib.parse import unquote, urlparse
+
+from trends_cli.api.env import env_warn
+
+
+class RemoteError(Exception):
+    """Error reply from the remote server."""
+
+
+class RedisBackend:
+    def __init__(
+        self,
+        host: str,
+        port: int = 6379,
+        db: int = 0,
+        password: str | None = None,
+        prefix: str = "trends:",
+        timeout: float = 0.5,
+        retry_after: float = 30.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.prefix = prefix
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._sock: socket.socket | None = None
+        self._rfile = None
+        self._down_until = 0.0
+        self._lock = threading.Lock()  # one connection, shared by fetch threads
+
+    @property
+    def url(self) -> str:
+        return f"redis://{self.host}:{self.port}/{self.db}"
+
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def get_many(self, names: list[str]) -> list[bytes | None]:
+        """One MGET for all names; all misses if the remote is unavailable."""
+        if not names:
+            return []
+        replies = self._pipeline([["MGET", *[self.prefix + n for n in names]]])
+        if replies is None:
+            self.misses += len(names)
+            return [None] * len(names)
+        values = replies[0]
+        found = sum(v is not None for v in values)
+        self.hits += found
+        self.misses += len(names) - found
+        return values
+
+    def set_many(self, items: list[tuple[str, bytes]], ttl: int) -> None:
+        """Pipelined SET … EX ttl for every item; dropped if the remote is unavailable."""
+        if items:
+            self._pipeline([["SET", self.prefix + n, blob, "EX", str(max(1, ttl))] for n, blob in items])
+
+    def delete(self, names: list[str]) -> None:
+        if names:
+            self._pipeline([["DEL", *[self.prefix + n for n in names]]])
+
+    def stats(self) -> dict:
+        return {
+            "url":       self.url,
+            "available": self.available(),
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "errors":    self.errors,
+        }
+
+    # -- protocol -----------------------------------------------------------
+
+    def _pipeline(self, commands: list[list[str | bytes]]) -> list | None:
+        """Send commands in one write, read one reply each. None on failure."""
+        with self._lock:
+            if not self.available():
+                return None
+            try:
+                sock = self._connect()
+                sock.sendall(b"".join(_encode(c) for c in commands))
+                replies = [self._read_reply() for _ in commands]
+            except (OSError, RemoteError, ValueError):
+                self.errors += 1
+                self._close()
+                self._down_until = time.monotonic() + self.retry_after
+                return None
+            return replies
+
+    def _connect(self) -> socket.socket:
+        if self._sock is not None:
+            return self._sock
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._sock = sock
+        self._rfile = sock.makefile("rb")
+        setup: list[list[str | bytes]] = []
+        if self.password:
+            setup.append(["AUTH", self.password])
+        if self.db:
+            setup.append(["SELECT", str(self.db)])
+        if setup:
+            sock.sendall(b"".join(_encode(c) for c in setup))
+            for _ in setup:
+                self._read_reply()
+        return sock
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._rfile = None
+
+    def _read_reply(self):
+        line = self._rfile.readline()
+        if not line.endswith(b"\r\n"):
+            raise OSError("connection closed")
+        kind, rest = line[:1], line[1:-2]
+        if kind == b"+":
+            return rest.decode()
+        if kind == b"-":
+            raise RemoteError(rest.decode(errors="replace"))
+        if kind == b":":
+            return int(rest)
+        if kind == b"$":
+            n = int(rest)
+            if n < 0:
+                return None
+            data = self._rfile.read(n + 2)
+            if len(data) != n + 2:
+                raise OSError("connection closed")
+            return data[:-2]
+        if kind == b"*":
+            n = int(rest)
+            return None if n < 0 else [self._read_reply() for _ in range(n)]
+        raise ValueError(f"unexpected reply: {line[:20]!r}")
+
+
+def _encode(command: list[str | bytes]) -> bytes:
+    parts = [b"*%d\r\n" % len(command)]
+    for arg in command:
+        b = arg if isinstance(arg, bytes) else arg.encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(b), b))
+    return b"".join(parts)
+
+
+def remote_from_env() -> RedisBackend | None:
+    """The backend for TRENDS_CACHE_REMOTE, or None. A bad URL warns and disables the tier."""
+    url = os.environ.get("TRENDS_CACHE_REMOTE", "")
+    if not url:
+        return None
+    u = urlparse(url)
+    try:
+        if u.scheme != "redis":
+            raise ValueError(f"unsupported scheme {u.scheme!r}, expected redis://")
+        db = u.path.lstrip("/")
+        return RedisBackend(
+            host=u.hostname or "localhost",
+            port=u.port or 6379,
+            db=int(db) if db else 0,
+            password=unquote(u.password) if u.password else None,
+            prefix=os.environ.get("TRENDS_CACHE_REMOTE_PREFIX", "trends:"),
+        )
+    except ValueError as e:
+        shown = url.replace(u.password, "***") if u.password else url
+        env_warn(f"ignoring TRENDS_CACHE_REMOTE={shown!r}: {e}; using the disk cache only")
+        return None
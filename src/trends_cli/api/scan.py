@@ -0,0 +1,130 @@
+"""Vectorized breakout scanning across many single-term series.
+
+Every term's series is loaded through the client (cache first), right-aligned
+on its latest point and stacked into one (terms × points) float array,
+NaN-padded where a series is shorter. All statistics are then computed in a single pass over the whole
+array with cumulative sums — no per-term Python loop after loading.
+"""
+
+import numpy as np
+
+from trends_cli.api.trends import TrendsClient, default_client
+from trends_cli.models import ScanResult
+
+# Points in one week per timeframe; week-over-week compares against this lag.
+# Monthly (`all`) and intraday windows fall back to period-over-period.
+_POINTS_PER_WEEK = {
+    "now 7-d":    168,
+    "today 1-m":  7,
+    "today 3-m":  7,
+    "today 12-m": 1,
+    "today 5-y":  1,
+}
+
+# Interest values are integers 0–100, so a flat series has std 0; flooring the
+# std at one point keeps a 0 → 3 blip from scoring as an infinite z
+_MIN_STD = 1.0
+
+
+def load_matrix(
+    queries: list[str],
+    timeframe: str,
+    geo: str,
+    client: TrendsClient | None = None,
+) -> tuple[list[str], list[str], np.ndarray]:
+    """Return (found queries, date labels, terms × points array).
+
+    Terms are loaded with client.interest_many, so the client's cache policy
+    (e.g. cache_only) and concurrency apply. Terms that fail or have no data
+    are left out.
+    """
+    client = client or default_client()
+    # Keep only the values per term as results arrive, so the batch's
+    # DataPoints don't all stay alive at once
+    rows: dict[str, list[int]] = {}
+    dates: list[str] = []
+    for r in client.interest_many(queries, timeframe, geo):
+        if not r.value:
+            continue
+        points = r.value[0].series
+        rows[r.queries[0]] = [dp.value for dp in points]
+        if len(points) > len(dates):
+            dates = [dp.date for dp in points]
+    names = [q for q in queries if q in rows]
+
+    width = max((len(r) for r in rows.values()), default=0)
+    matrix = np.full((len(names), width), np.nan)
+    for i, q in enumerate(names):
+        matrix[i, width - len(rows[q]):] = rows[q]
+    return names, dates, matrix
+
+
+def scan_matrix(
+    queries: list[str],
+    matrix: np.ndarray,
+    timeframe: str,
+    window: int = 12,
+    z_threshold: float = 3.0,
+) -> list[ScanResult]:
+    """Score the latest point of every row against its trailing window.
+
+    - zscore: latest value vs. mean/std of the previous `window` points
+    - wow_change: percent change vs. one week earlier
+    - breakout: zscore ≥ z_threshold and the latest value beats the window max
+
+    Returned in descending zscore order.
+    """
+    n, t = matrix.shape
+    if n == 0 or t < 2:
+        return []
+    window = max(2, min(window, t - 1))
+
+    mask = ~np.isnan(matrix)
+    x = np.where(mask, matrix, 0.0)
+    last = matrix[:, -1]
+
+    # Trailing window [t-1-window, t-1) via prefix sums: one pass over the array
+    c1 = np.cumsum(x, axis=1)
+    c2 = np.cumsum(x * x, axis=1)
+    cn = np.cumsum(mask, axis=1)
+
+    def _window_sum(c: np.ndarray) -> np.ndarray:
+        hi = c[:, t - 2]
+        lo = c[:, t - 2 - window] if t - 2 - window >= 0 else 0.0
+        return hi - lo
+
+    cnt = _window_sum(cn)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = _window_sum(c1) / cnt
+        var = _window_sum(c2) / cnt - mean * mean
+        std = np.maximum(np.sqrt(np.maximum(var, 0.0)), _MIN_STD)
+        z = np.where(cnt >= 2, (last - mean) / std, 0.0)
+
+    win_max = np.nanmax(np.where(mask[:, t - 1 - window:t - 1], matrix[:, t - 1 - window:t - 1], -np.inf), axis=1)
+    breakout = (z >= z_threshold) & (last > win_max)
+
+    lag = _POINTS_PER_WEEK.get(timeframe, 1)
+    if lag < t:
+        prev = matrix[:, -1 - lag]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            wow = (last - prev) / np.maximum(prev, 1.0) * 100.0
+    else:
+        wow = np.full(n, np.nan)
+
+    with np.errstate(invalid="ignore"):
+        avg = np.nanmean(matrix, axis=1)
+        peak = np.nanmax(matrix, axis=1)
+
+    order = np.lexsort((-np.nan_to_num(wow, nan=-np.inf), -z))
+    return [
+        ScanResult(
+            query=queries[i],
+            current_value=float(last[i]),
+            avg_value=round(float(avg[i]), 1),
+            peak_value=float(peak[i]),
+            zscore=round(float(z[i]), 2),
+            wow_change=None if np.isnan(wow[i]) else round(float(wow[i]), 1),
+            breakout=bool(breakout[i]),
+        )
+        for i in order
+    ]
@@ -1,53 +1,819 @@
-"""pytrends wrapper with JSON cache."""
+"""Google Trends client with a tiered response cache.
 
-import hashlib
+``TrendsClient`` owns the request configuration — language, timezone, HTTP
+timeout, retries, the egress proxy pool and its rate budgets — and the cache
+policy. Single calls raise ``FetchError`` when a request fails; an empty
+result is a success. Only successes are cached, so a failed request is
+retried on the next call instead of being served as "no data" for the TTL.
+
+Bulk calls (``interest_many``, ``related_many``) run on the client's thread
+pool and yield one ``FetchResult`` per item as it completes, or as an async
+iterator (``ainterest_many``, ``arelated_many``). Every call takes a timeout;
+bulk calls also stop early when a ``cancel`` event is set or the consumer
+stops iterating.
+
+The module-level ``fetch_*`` functions are kept for existing callers and go
+through ``default_client()``, a shared client configured from the environment.
+"""
+
+import asyncio
 import json
-import os
+import queue
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator
 
-from pytrends.request import TrendReq
+import requests
+from pytrends.request import BASE_TRENDS_URL, TrendReq
 
+from trends_cli.api.cache import cache_prefetch, cache_read, cache_write, mem_cache, mem_put
+from trends_cli.api.env import env_float, env_int
+from trends_cli.api.proxies import DIRECT, ProxyPool, ProxyState, is_throttled, pool_from_env
 from trends_cli.models import DataPoint, RelatedItem, TrendSeries, TrendingSearch
 from trends_cli.display.format import geo_to_pn
 
-_CACHE_DIR = Path("/tmp/trends_cache")
-_CACHE_TTL = 300  # 5 minutes
 
+def interest_cache_key(queries: list[str], timeframe: str, geo: str) -> str:
+    return json.dumps({"q": sorted(queries), "tf": timeframe, "geo": geo})
 
-def _cache_path(key: str) -> Path:
-    digest = hashlib.sha256(key.encode()).hexdigest()
-    return _CACHE_DIR / f"{digest}.json"
 
+def related_cache_key(query: str, geo: str) -> str:
+    return json.dumps({"related": query, "geo": geo})
 
-def _cache_read(key: str) -> dict | None:
-    path = _cache_path(key)
-    if not path.exists():
-        return None
-    try:
-        with open(path) as f:
-            data = json.load(f)
-        if time.time() - data.get("_ts", 0) > _CACHE_TTL:
+
+def trending_cache_key(geo: str, realtime: bool) -> str:
+    return json.dumps({"trending": geo, "realtime": realtime})
+
+
+_RETRIES = env_int("TRENDS_RETRIES", 0)
+_BACKOFF = env_float("TRENDS_BACKOFF", 0.0)
+_TIMEOUT = env_float("TRENDS_TIMEOUT", 5.0)
+
+_CONNECT_TIMEOUT = 2.0
+_CANCEL_POLL_S = 0.1
+
+# Shared by every client built from the environment, so rate budgets hold
+# across them within a process
+_env_pool = pool_from_env()
+
+
+class FetchError(Exception):
+    """A request to Google Trends failed — as opposed to returning no data."""
+
+    def __init__(self, message: str, throttled: bool = False) -> None:
+        super().__init__(message)
+        self.throttled = throttled
+
+
+class DeadlineExceeded(FetchError):
+    """The call's timeout ran out before a response arrived."""
+
+
+class Cancelled(FetchError):
+    """A bulk call was cancelled before this item finished."""
+
+
+class NotCached(FetchError):
+    """The client is cache-only and the entry is missing or stale."""
+
+
+@dataclass
+class FetchResult:
+    """Outcome of one item of a bulk call."""
+
+    queries: list[str]
+    value: Any = None                 # list[TrendSeries] or related dict on success
+    error: FetchError | None = field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def empty(self) -> bool:
+        """Succeeded but Google had no data for the item."""
+        if self.error is not None:
+            return False
+        return not any(self.value.values()) if isinstance(self.value, dict) else not self.value
+
+
+def _retryable(exc: BaseException) -> bool:
+    """Connection errors, timeouts, 429s and the 5xx codes pytrends itself retries."""
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None) in TrendReq.ERROR_CODES
+
+
+class _TrendReq(TrendReq):
+    """TrendReq that retries each HTTP request itself and keeps to a deadline.
+
+    pytrends' own retries build urllib3's Retry(method_whitelist=...), which
+    urllib3 2 rejects, so any nonzero retries/backoff_factor breaks every
+    request. Retrying here also covers the consent-cookie request.
+
+    One pytrends call is several requests (consent cookie, widget token,
+    data), so the deadline is checked and the read timeout capped at the
+    time left before each of them, not once per session.
+    """
+
+    def __init__(
+        self,
+        retries: int,
+        backoff: float,
+        read_timeout: float,
+        deadline: float | None,
+        **kwargs: Any,
+    ) -> None:
+        self._retries = retries
+        self._backoff = backoff
+        self._read_timeout = read_timeout
+        self._deadline = deadline
+        self._with_retries(lambda: TrendReq.__init__(self, timeout=self._timeout(), **kwargs))
+
+    def GetGoogleCookie(self):
+        """The NID consent cookie, fetched through this session's proxy.
+
+        pytrends' version loops on ProxyError, print()s to stdout (corrupting
+        JSON output) and removes the proxy from its list; here the error
+        propagates to _session like any other failure.
+        """
+        response = requests.get(
+            f"{BASE_TRENDS_URL}/explore/?geo={self.hl[-2:]}",
+            timeout=self.timeout,
+            proxies={"https": self.proxies[0]} if self.proxies else None,
+            **self.requests_args,
+        )
+        return {k: v for k, v in response.cookies.items() if k == "NID"}
+
+    def _get_data(self, url, method=TrendReq.GET_METHOD, trim_chars=0, **kwargs):
+        def send():
+            self.timeout = self._timeout()
+            return TrendReq._get_data(self, url, method, trim_chars, **kwargs)
+
+        return self._with_retries(send)
+
+    def _timeout(self) -> tuple[float, float]:
+        """(connect, read) timeout for the next request. Raises DeadlineExceeded."""
+        read = self._read_timeout
+        if self._deadline is not None:
+            read = min(read, self._deadline - time.monotonic())
+            if read <= 0:
+                raise DeadlineExceeded("timed out")
+        return min(_CONNECT_TIMEOUT, read), read
+
+    def _with_retries(self, send: Callable[[], Any]) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return send()
+            except Exception as e:
+                pause = self._backoff * 2 ** attempt
+                out_of_time = self._deadline is not None and time.monotonic() + pause >= self._deadline
+                if attempt >= self._retries or out_of_time or not _retryable(e):
+                    raise
+            time.sleep(pause)
+            attempt += 1
+
+
+def _deadline(timeout: float | None) -> float | None:
+    return None if timeout is None else time.monotonic() + timeout
+
+
+class TrendsClient:
+    def __init__(
+        self,
+        hl: str = "en-US",
+        tz: int = 360,
+        timeout: float = _TIMEOUT,
+        retries: int = 0,
+        backoff: float = 0.0,
+        proxies: list[str] | None = None,
+        rate_per_min: float | None = None,
+        proxy_strategy: str = "round-robin",
+        pool: ProxyPool | None = None,
+        cache: bool = True,
+        max_age: float | None = None,
+        cache_only: bool = False,
+        workers: int = 8,
+    ) -> None:
+        """
+        timeout:       per-request read timeout in seconds
+        proxies:       egress proxy URLs ("direct" = this host); with
+                       rate_per_min, each gets a token bucket. A rate without
+                       proxies rate-limits the host's own IP.
+        pool:          an existing ProxyPool to share instead
+        cache:         read and write the response cache
+        max_age:       only use cache entries younger than this (default: TTL)
+        cache_only:    never hit the network; misses raise NotCached
+        workers:       threads for bulk calls
+        """
+        self.hl = hl
+        self.tz = tz
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
+        self.max_age = max_age
+        self.cache_only = cache_only
+        self.workers = workers
+        if pool is None and (proxies or rate_per_min):
+            pool = ProxyPool(proxies or [DIRECT], rate_per_min or 20.0, strategy=proxy_strategy)
+        self._pool = pool
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, **overrides: Any) -> "TrendsClient":
+        """A client configured from TRENDS_* environment variables."""
+        config: dict[str, Any] = {"retries": _RETRIES, "backoff": _BACKOFF, "pool": _env_pool}
+        config.update(overrides)
+        return cls(**config)
+
+    def close(self) -> None:
+        """Cancel queued bulk work and release the thread pool."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def __enter__(self) -> "TrendsClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -- sessions -----------------------------------------------------------
+
+    def _pt(self, proxy: ProxyState | None, deadline: float | None) -> TrendReq:
+        return _TrendReq(
+            self.retries,
+            self.backoff,
+            self.timeout,
+            deadline,
+            hl=self.hl,
+            tz=self.tz,
+            proxies=proxy.proxies if proxy else [],
+        )
+
+    @contextmanager
+    def _session(self, deadline: float | None = None) -> Iterator[TrendReq]:
+        """A TrendReq bound to the next proxy in the pool, recording the outcome.
+
+        Anything raised inside becomes a FetchError (DeadlineExceeded once the
+        deadline has passed). Waiting for a proxy token counts against the
+        deadline, and each HTTP request's timeout is capped at the time left
+        (see _TrendReq).
+        """
+        if self.cache_only:
+            raise NotCached("not in cache")
+
+        proxy = None
+        if self._pool is not None:
+            wait_s = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                proxy = self._pool.acquire(wait_s)
+            except TimeoutError:
+                raise DeadlineExceeded("timed out waiting for a proxy") from None
+
+        if deadline is not None and time.monotonic() >= deadline:
+            # Nothing was sent, so there is no outcome to record
+            if proxy is not None:
+                self._pool.cancel(proxy)
+            raise DeadlineExceeded("timed out")
+
+        # A request cut short by the caller's deadline says nothing about the
+        # proxy, so it is not charged; only failures it caused (transport
+        # errors, 429, 5xx) count toward quarantine
+        t0 = time.monotonic()
+        ok = throttled = timed_out = False
+        try:
+            yield self._pt(proxy, deadline)
+            ok = True
+        except DeadlineExceeded:
+            timed_out = True
+            raise
+        except FetchError:
+            raise
+        except Exception as e:
+            throttled = is_throttled(e)
+            if deadline is not None and time.monotonic() >= deadline:
+                timed_out = not throttled
+                raise DeadlineExceeded(f"timed out: {type(e).__name__}: {e}") from e
+            raise FetchError(f"{type(e).__name__}: {e}", throttled) from e
+        finally:
+            if proxy is not None and timed_out:
+                self._pool.abandon(proxy)
+            elif proxy is not None:
+                self._pool.release(proxy, ok, throttled, time.monotonic() - t0)
+
+    def proxy_stats(self) -> list[dict]:
+        """Per-proxy request, error, 429 and latency counters for this client."""
+        return self._pool.stats() if self._pool is not None else []
+
+    def probe_proxies(self, rounds: int = 1) -> list[dict]:
+        """Open a session through every proxy `rounds` times and return proxy_stats().
+
+        Opening a TrendReq fetches Google's consent cookie, so this exercises the
+        full egress path without spending a Trends query.
+        """
+        if self._pool is None:
+            return []
+        for _ in range(rounds * len(self._pool.stats())):
+            try:
+                with self._session():
+                    pass
+            except FetchError:
+                continue
+        return self.proxy_stats()
+
+    # -- cache --------------------------------------------------------------
+
+    def _mem_get(self, key: str, no_cache: bool) -> Any | None:
+        if no_cache or not self.cache:
+            mem_cache.invalidate(key)
+            return None
+        return mem_cache.get(key, self.max_age)
+
+    def _disk_get(self, key: str, no_cache: bool) -> dict | None:
+        if no_cache or not self.cache:
+            return None
+        data = cache_read(key)
+        if data is not None and self.max_age is not None and time.time() - data.get("_ts", 0) > self.max_age:
             return None
         return data
-    except (json.JSONDecodeError, OSError):
-        return None
 
+    def cached(self, key: str) -> dict | None:
+        """The cached payload for key under this client's cache policy, or None."""
+        return self._disk_get(key, no_cache=False)
+
+    def _put(self, key: str, payload: dict) -> None:
+        if self.cache:
+            cache_write(key, payload)
+
+    def _mem_put(self, key: str, value: Any, payload: dict) -> None:
+        if self.cache:
+            mem_put(key, value, payload)
+
+    # -- single calls -------------------------------------------------------
+
+    def interest(
+        self,
+        queries: list[str],
+        timeframe: str,
+        geo: str,
+        no_cache: bool = False,
+        timeout: float | None = None,
+    ) -> list[TrendSeries]:
+        """Interest over time for one or more queries, normalized together.
+
+        Returns one TrendSeries per query that has data ([] if none does).
+        Raises FetchError if the request fails.
+        """
+        deadline = _deadline(timeout)
+        return self._call(lambda: self._interest(queries, timeframe, geo, no_cache, deadline), deadline)
+
+    def related(
+        self,
+        query: str,
+        geo: str,
+        no_cache: bool = False,
+        timeout: float | None = None,
+    ) -> dict[str, list[RelatedItem]]:
+        """{"top_queries", "rising_queries", "top_topics", "rising_topics"}. Raises FetchError."""
+        deadline = _deadline(timeout)
+        return self._call(lambda: self._related(query, geo, no_cache, deadline), deadline)
+
+    def trending(
+        self,
+        geo: str,
+        realtime: bool = False,
+        no_cache: bool = False,
+        timeout: float | None = None,
+    ) -> list[TrendingSearch]:
+        """Trending searches. Uses realtime endpoint; falls back to top searches. Raises FetchError."""
+        deadline = _deadline(timeout)
+        return self._call(lambda: self._trending(geo, realtime, no_cache, deadline), deadline)
+
+    def _call(self, fn: Callable[[], Any], deadline: float | None) -> Any:
+        """Run a single call, giving up at the deadline.
+
+        With a deadline the call runs on the thread pool and is waited on like
+        a bulk item, so a slow server cannot hold the caller past it. The
+        abandoned request stops at its own capped timeout.
+        """
+        if deadline is None:
+            return fn()
+        future = self._get_executor().submit(fn)
+        done, _ = wait([future], timeout=max(0.0, deadline - time.monotonic()))
+        if not done:
+            future.cancel()
+            raise DeadlineExceeded("timed out")
+        return future.result()
+
+    def _interest(
+        self,
+        queries: list[str],
+        timeframe: str,
+        geo: str,
+        no_cache: bool,
+        deadline: float | None,
+    ) -> list[TrendSeries]:
+        hit = self._interest_cached(queries, timeframe, geo, no_cache)
+        if hit is not None:
+            return hit
+
+        cache_key = interest_cache_key(queries, timeframe, geo)
+        with self._session(deadline) as pt:
+            pt.build_payload(kw_list=queries, timeframe=timeframe, geo=geo)
+            df = pt.interest_over_time()
+
+        raw: dict[str, list] = {}
+        if not df.empty:
+            # Drop the isPartial column
+            df = df.drop(columns=["isPartial"], errors="ignore")
+            for col in df.columns:
+                raw[str(col)] = [
+                    {"date": str(idx.date()), "value": int(val)}
+                    for idx, val in zip(df.index, df[col])
+                ]
+
+        fetched_at = datetime.utcnow().isoformat()
+        payload = {"raw": raw, "fetched_at": fetched_at, "timeframe": timeframe, "geo": geo}
+        self._put(cache_key, payload)
+
+        result = series_from_payload(queries, payload)
+        self._mem_put(cache_key, result, payload)
+        return result
+
+    def _interest_cached(
+        self,
+        queries: list[str],
+        timeframe: str,
+        geo: str,
+        no_cache: bool,
+    ) -> list[TrendSeries] | None:
+        cache_key = interest_cache_key(queries, timeframe, geo)
+
+        # Memory shares the disk key, so every ordering of a query set is one
+        # entry (and --no-cache drops all of them); reorder for this caller
+        hit = self._mem_get(cache_key, no_cache)
+        if hit is not None:
+            by_query = {s.query: s for s in hit}
+            return [by_query[q] for q in queries if q in by_query]
+
+        cached = self._disk_get(cache_key, no_cache)
+        if cached is None:
+            return None
+        result = series_from_payload(queries, cached)
+        self._mem_put(cache_key, result, cached)
+        return result
+
+    def _related(
+        self,
+        query: str,
+        geo: str,
+        no_cache: bool,
+        deadline: float | None,
+    ) -> dict[str, list[RelatedItem]]:
+        cache_key = related_cache_key(query, geo)
+
+        hit = self._mem_get(cache_key, no_cache)
+        if hit is not None:
+            return hit
+
+        cached = self._disk_get(cache_key, no_cache)
+
+        if cached is None:
+            def _df_to_list(df, title_col: str) -> list[dict]:
+                if df is None or not hasattr(df, "iterrows") or df.empty:
+                    return []
+                rows = []
+                for _, row in df.iterrows():
+                    try:
+                        title = str(row.get(title_col) or row.get("query") or "")
+                        val   = str(row.get("value", ""))
+                        if title:
+                            rows.append({"title": title, "value": val})
+                    except Exception:
+                        continue
+                return rows
+
+            q_top: list[dict] = []
+            q_rising: list[dict] = []
+            t_top: list[dict] = []
+            t_rising: list[dict] = []
+
+            with self._session(deadline) as pt:
+                pt.build_payload(kw_list=[query], timeframe="today 12-m", geo=geo)
+
+                # pytrends raises KeyError/IndexError while parsing a response
+                # with no ranked list: that is "no data", not a failure
+                try:
+                    queries = pt.related_queries()
+                    q_top   = _df_to_list(queries.get(query, {}).get("top"), "query")
+                    q_rising = _df_to_list(queries.get(query, {}).get("rising"), "query")
+                except (KeyError, IndexError):
+                    pass
+
+                try:
+                    topics  = pt.related_topics()
+                    t_top   = _df_to_list(topics.get(query, {}).get("top"), "topic_title")
+                    t_rising = _df_to_list(topics.get(query, {}).get("rising"), "topic_title")
+                except (KeyError, IndexError):
+                    pass
+
+            payload = {
+                "top_queries":     q_top,
+                "rising_queries":  q_rising,
+                "top_topics":      t_top,
+                "rising_topics":   t_rising,
+            }
+            self._put(cache_key, payload)
+            cached = payload
+
+        def _to_items(lst: list[dict]) -> list[RelatedItem]:
+            return [RelatedItem(title=d["title"], value=str(d["value"])) for d in lst]
+
+        result = {
+            "top_queries":    _to_items(cached.get("top_queries", [])),
+            "rising_queries": _to_items(cached.get("rising_queries", [])),
+            "top_topics":     _to_items(cached.get("top_topics", [])),
+            "rising_topics":  _to_items(cached.get("rising_topics", [])),
+        }
+        self._mem_put(cache_key, result, cached)
+        return result
+
+    def _trending(
+        self,
+        geo: str,
+        realtime: bool,
+        no_cache: bool,
+        deadline: float | None,
+    ) -> list[TrendingSearch]:
+        cache_key = trending_cache_key(geo, realtime)
+
+        hit = self._mem_get(cache_key, no_cache)
+        if hit is not None:
+            return hit
+
+        cached = self._disk_get(cache_key, no_cache)
+
+        if cached is None:
+            rows: list[dict] = []
+
+            # The realtime endpoint is often unavailable for a geo; only fail
+            # if the fallback fails too
+            try:
+                with self._session(deadline) as pt:
+                    df = pt.realtime_trending_searches(pn=geo.upper() or "US")
+                if not df.empty:
+                    title_col = "title" if "title" in df.columns else df.columns[0]
+                    for i, row in enumerate(df.itertuples(), 1):
+                        title = getattr(row, title_col, str(row[1]))
+                        rows.append({"rank": i, "title": str(title), "traffic": ""})
+            except DeadlineExceeded:
+                raise
+            except FetchError:
+                pass
+
+            if not rows:
+                # Fallback: top searches for the query "news" in the geo
+                with self._session(deadline) as pt:
+                    pt.build_payload(kw_list=["news"], timeframe="now 7-d", geo=geo)
+                    try:
+                        rq = pt.related_queries()
+                    except (KeyError, IndexError):
+                        rq = {}
+                top_df = rq.get("news", {}).get("top")
+                if top_df is not None and not top_df.empty:
+                    for i, r in enumerate(top_df.itertuples(), 1):
+                        title = getattr(r, "query", str(r[1]))
+                        rows.append({"rank": i, "title": str(title), "traffic": ""})
+
+            payload = {"rows": rows}
+            self._put(cache_key, payload)
+            cached = payload
+
+        result = [
+            TrendingSearch(rank=r["rank"], title=r["title"], traffic=r.get("traffic", ""))
+            for r in cached.get("rows", [])
+        ]
+        self._mem_put(cache_key, result, cached)
+        return result
+
+    # -- bulk calls ---------------------------------------------------------
+
+    def interest_many(
+        self,
+        queries: Iterable[str | list[str]],
+        timeframe: str,
+        geo: str,
+        no_cache: bool = False,
+        timeout: float | None = None,
+        cancel: threading.Event | None = None,
+    ) -> Iterator[FetchResult]:
+        """Fetch each item — a term, or a list of terms fetched together — concurrently.
+
+        Yields a FetchResult per item as it completes (value: list[TrendSeries]).
+        Items still unfinished when timeout runs out or cancel is set are
+        yielded as failed (DeadlineExceeded / Cancelled); closing the iterator
+        early drops them.
+        """
+        items = [[q] if isinstance(q, str) else list(q) for q in queries]
+        deadline = _deadline(timeout)
+        if self.cache and not no_cache:
+            cache_prefetch([interest_cache_key(i, timeframe, geo) for i in items])
+        return self._run_many(
+            items,
+            lambda i: self._interest(i, timeframe, geo, no_cache, deadline),
+            deadline,
+            cancel,
+            lookup=lambda i: self._interest_cached(i, timeframe, geo, no_cache),
+        )
+
+    def related_many(
+        self,
+        queries: Iterable[str],
+        geo: str,
+        no_cache: bool = False,
+        timeout: float | None = None,
+        cancel: threading.Event | None = None,
+    ) -> Iterator[FetchResult]:
+        """related() for each query concurrently; same contract as interest_many."""
+        items = [[q] for q in queries]
+        deadline = _deadline(timeout)
+        if self.cache and not no_cache:
+            cache_prefetch([related_cache_key(i[0], geo) for i in items])
+        return self._run_many(
+            items, lambda i: self._related(i[0], geo, no_cache, deadline), deadline, cancel
+        )
+
+    async def ainterest_many(
+        self,
+        queries: Iterable[str | list[str]],
+        timeframe: str,
+        geo: str,
+        no_cache: bool = False,
+        timeout: float | None = None,
+    ) -> AsyncIterator[FetchResult]:
+        """Async interest_many. Cancelling the consuming task cancels pending items."""
+        items = [[q] if isinstance(q, str) else list(q) for q in queries]
+        deadline = _deadline(timeout)
+        if self.cache and not no_cache:
+            keys = [interest_cache_key(i, timeframe, geo) for i in items]
+            await asyncio.get_running_loop().run_in_executor(self._get_executor(), cache_prefetch, keys)
+        async for r in self._arun_many(
+            items, lambda i: self._interest(i, timeframe, geo, no_cache, deadline), deadline
+        ):
+            yield r
+
+    async def arelated_many(
+        self,
+        queries: Iterable[str],
+        geo: str,
+        no_cache: bool = False,
+        timeout: float | None = None,
+    ) -> AsyncIterator[FetchResult]:
+        """Async related_many. Cancelling the consuming task cancels pending items."""
+        items = [[q] for q in queries]
+        deadline = _deadline(timeout)
+        if self.cache and not no_cache:
+            keys = [related_cache_key(i[0], geo) for i in items]
+            await asyncio.get_running_loop().run_in_executor(self._get_executor(), cache_prefetch, keys)
+        async for r in self._arun_many(
+            items, lambda i: self._related(i[0], geo, no_cache, deadline), deadline
+        ):
+            yield r
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max(1, self.workers), thread_name_prefix="trends")
+            return self._executor
+
+    def _run_many(
+        self,
+        items: list[list[str]],
+        fn: Callable[[list[str]], Any],
+        deadline: float | None,
+        cancel: threading.Event | None,
+        lookup: Callable[[list[str]], Any | None] | None = None,
+    ) -> Iterator[FetchResult]:
+        # Items lookup can answer (cache hits) are yielded straight from this
+        # thread: handing a local read to the pool costs more than the read.
+        # Completed futures arrive through callbacks, so each one costs O(1)
+        # rather than a wait() over the whole pending set (O(n²) for big batches)
+        executor = self._get_executor()
+        completed: queue.SimpleQueue[Future] = queue.SimpleQueue()
+        futures: dict[Future, list[str]] = {}
+        pending: set[Future] = set()
+        unstarted: list[list[str]] = []
+
+        def stopped() -> bool:
+            return (cancel is not None and cancel.is_set()) or (
+                deadline is not None and time.monotonic() >= deadline
+            )
+
+        try:
+            for n, item in enumerate(items):
+                if stopped():
+                    unstarted = items[n:]
+                    break
+                value = lookup(item) if lookup is not None else None
+                if value is not None:
+                    yield FetchResult(item, value)
+                    continue
+                f = executor.submit(fn, item)
+                futures[f] = item
+                pending.add(f)
+                f.add_done_callback(completed.put)
+
+            while pending and not stopped():
+                wait_s = _CANCEL_POLL_S if cancel is not None else None
+                if deadline is not None:
+                    left = max(0.0, deadline - time.monotonic())
+                    wait_s = left if wait_s is None else min(wait_s, left)
+                try:
+                    f = completed.get(timeout=wait_s)
+                except queue.Empty:
+                    continue
+                pending.discard(f)
+                yield _outcome(futures[f], f)
+
+            for f in list(pending):
+                f.cancel()
+            cut_off = Cancelled("cancelled") if cancel is not None and cancel.is_set() else DeadlineExceeded("timed out")
+            while pending:
+                yield FetchResult(futures[pending.pop()], error=cut_off)
+            for item in unstarted:
+                yield FetchResult(item, error=cut_off)
+        finally:
+            for f in pending:
+                f.cancel()
+
+    async def _arun_many(
+        self,
+        items: list[list[str]],
+        fn: Callable[[list[str]], Any],
+        deadline: float | None,
+    ) -> AsyncIterator[FetchResult]:
+        executor = self._get_executor()
+        futures = {asyncio.wrap_future(executor.submit(fn, item)): item for item in items}
+        pending = set(futures)
+        try:
+            while pending:
+                left = None if deadline is None else deadline - time.monotonic()
+                if left is not None and left <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=left, return_when=asyncio.FIRST_COMPLETED)
+                for f in done:
+                    yield _outcome(futures[f], f)
 
-def _cache_write(key: str, data: dict) -> None:
-    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    data["_ts"] = time.time()
-    path = _cache_path(key)
+            for f in list(pending):
+                f.cancel()
+            while pending:
+                yield FetchResult(futures[pending.pop()], error=DeadlineExceeded("timed out"))
+        finally:
+            for f in pending:
+                f.cancel()
+
+
+def _outcome(queries: list[str], future: Future | asyncio.Future) -> FetchResult:
     try:
-        with open(path, "w") as f:
-            json.dump(data, f)
-    except OSError:
-        pass
+        return FetchResult(queries, future.result())
+    except FetchError as e:
+        return FetchResult(queries, error=e)
+    except Exception as e:
+        err = FetchError(f"{type(e).__name__}: {e}")
+        err.__cause__ = e
+        return FetchResult(queries, error=err)
+
 
+_default: TrendsClient | None = None
+_default_lock = threading.Lock()
 
-def _pt() -> TrendReq:
-    return TrendReq(hl="en-US", tz=360)
+
+def default_client() -> TrendsClient:
+    """The shared client configured from the environment, created on first use."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = TrendsClient.from_env()
+        return _default
+
+
+def proxy_stats() -> list[dict]:
+    """Per-proxy request, error, 429 and latency counters for this process."""
+    return default_client().proxy_stats()
+
+
+def probe_proxies(rounds: int = 1) -> list[dict]:
+    return default_client().probe_proxies(rounds)
 
 
 # ---------------------------------------------------------------------------
@@ -63,48 +829,28 @@ def fetch_interest(
     """Fetch interest over time for one or more queries.
 
     Returns one TrendSeries per query, normalized together (Google Trends
-    always returns relative values across the full query set).
+    always returns relative values across the full query set). Raises
+    FetchError if the request fails.
     """
-    cache_key = json.dumps({"q": sorted(queries), "tf": timeframe, "geo": geo})
-
-    cached = None if no_cache else _cache_read(cache_key)
-
-    if cached is None:
-        pt = _pt()
-        pt.build_payload(kw_list=queries, timeframe=timeframe, geo=geo)
-        df = pt.interest_over_time()
-        if df.empty:
-            return []
-
-        # Drop the isPartial column
-        df = df.drop(columns=["isPartial"], errors="ignore")
+    return default_client().interest(queries, timeframe, geo, no_cache)
 
-        raw: dict[str, list] = {}
-        for col in df.columns:
-            raw[str(col)] = [
-                {"date": str(idx.date()), "value": int(val)}
-                for idx, val in zip(df.index, df[col])
-            ]
-
-        fetched_at = datetime.utcnow().isoformat()
-        payload = {"raw": raw, "fetched_at": fetched_at, "timeframe": timeframe, "geo": geo}
-        _cache_write(cache_key, payload)
-        cached = payload
 
+def series_from_payload(queries: list[str], payload: dict) -> list[TrendSeries]:
+    """Build one TrendSeries per query from a cached interest payload."""
     result = []
     for q in queries:
         # Match by original query (pytrends uses the query as column name)
-        col_data = cached["raw"].get(q)
+        col_data = payload["raw"].get(q)
         if col_data is None:
             # pytrends may truncate/alter the key; try case-insensitive match
-            for k, v in cached["raw"].items():
+            for k, v in payload["raw"].items():
                 if k.lower() == q.lower():
                     col_data = v
                     break
         if col_data is None:
             continue
 
-        series = [DataPoint(date=d["date"], value=d["value"]) for d in col_data]
+        series = [DataPoint(d["date"], d["value"]) for d in col_data]
         values = [dp.value for dp in series]
 
         if not values:
@@ -116,14 +862,15 @@ def fetch_interest(
 
         result.append(TrendSeries(
             query=q,
-            timeframe=cached["timeframe"],
-            geo=cached["geo"],
-            fetched_at=cached["fetched_at"],
+            timeframe=payload["timeframe"],
+            geo=payload["geo"],
+            fetched_at=payload["fetched_at"],
             series=series,
             peak_value=peak_val,
             peak_date=peak_date,
             current_value=values[-1],
             avg_value=round(sum(values) / len(values), 1),
+            derived_from=payload.get("derived_from", ""),
         ))
 
     return result
@@ -138,65 +885,8 @@ def fetch_related(
     geo: str,
     no_cache: bool = False,
 ) -> dict[str, list[RelatedItem]]:
-    """Return {"top_queries", "rising_queries", "top_topics", "rising_topics"}."""
-    cache_key = json.dumps({"related": query, "geo": geo})
-    cached = None if no_cache else _cache_read(cache_key)
-
-    if cached is None:
-        pt = _pt()
-        pt.build_payload(kw_list=[query], timeframe="today 12-m", geo=geo)
-
-        def _df_to_list(df, title_col: str) -> list[dict]:
-            if df is None or not hasattr(df, "iterrows") or df.empty:
-                return []
-            rows = []
-            for _, row in df.iterrows():
-                try:
-                    title = str(row.get(title_col) or row.get("query") or "")
-                    val   = str(row.get("value", ""))
-                    if title:
-                        rows.append({"title": title, "value": val})
-                except Exception:
-                    continue
-            return rows
-
-        q_top: list[dict] = []
-        q_rising: list[dict] = []
-        t_top: list[dict] = []
-        t_rising: list[dict] = []
-
-        try:
-            queries = pt.related_queries()
-            q_top   = _df_to_list(queries.get(query, {}).get("top"), "query")
-            q_rising = _df_to_list(queries.get(query, {}).get("rising"), "query")
-        except Exception:
-            pass
-
-        try:
-            topics  = pt.related_topics()
-            t_top   = _df_to_list(topics.get(query, {}).get("top"), "topic_title")
-            t_rising = _df_to_list(topics.get(query, {}).get("rising"), "topic_title")
-        except Exception:
-            pass
-
-        payload = {
-            "top_queries":     q_top,
-            "rising_queries":  q_rising,
-            "top_topics":      t_top,
-            "rising_topics":   t_rising,
-        }
-        _cache_write(cache_key, payload)
-        cached = payload
-
-    def _to_items(lst: list[dict]) -> list[RelatedItem]:
-        return [RelatedItem(title=d["title"], value=str(d["value"])) for d in lst]
-
-    return {
-        "top_queries":    _to_items(cached.get("top_queries", [])),
-        "rising_queries": _to_items(cached.get("rising_queries", [])),
-        "top_topics":     _to_items(cached.get("top_topics", [])),
-        "rising_topics":  _to_items(cached.get("rising_topics", [])),
-    }
+    """Return {"top_queries", "rising_queries", "top_topics", "rising_topics"}. Raises FetchError."""
+    return default_client().related(query, geo, no_cache)
 
 
 # ---------------------------------------------------------------------------
@@ -208,42 +898,5 @@ def fetch_trending(
     realtime: bool = False,
     no_cache: bool = False,
 ) -> list[TrendingSearch]:
-    """Fetch trending searches. Uses realtime endpoint; falls back to top searches."""
-    cache_key = json.dumps({"trending": geo, "realtime": realtime})
-    cached = None if no_cache else _cache_read(cache_key)
-
-    if cached is None:
-        pt = _pt()
-        rows: list[dict] = []
-
-        try:
-            df = pt.realtime_trending_searches(pn=geo.upper() or "US")
-            if not df.empty:
-                title_col = "title" if "title" in df.columns else df.columns[0]
-                for i, row in enumerate(df.itertuples(), 1):
-                    title = getattr(row, title_col, str(row[1]))
-                    rows.append({"rank": i, "title": str(title), "traffic": ""})
-        except Exception:
-            pass
-
-        if not rows:
-            # Fallback: top searches for the query "news" in the geo
-            try:
-                pt.build_payload(kw_list=["news"], timeframe="now 7-d", geo=geo)
-                rq = pt.related_queries()
-                top_df = rq.get("news", {}).get("top")
-                if top_df is not None and not top_df.empty:
-                    for i, r in enumerate(top_df.itertuples(), 1):
-                        title = getattr(r, "query", str(r[1]))
-                        rows.append({"rank": i, "title": str(title), "traffic": ""})
-            except Exception:
-                pass
-
-        payload = {"rows": rows}
-        _cache_write(cache_key, payload)
-        cached = payload
-
-    return [
-        TrendingSearch(rank=r["rank"], title=r["title"], traffic=r.get("traffic", ""))
-        for r in cached.get("rows", [])
-    ]
+    """Fetch trending searches. Uses realtime endpoint; falls back to top searches. Raises FetchError."""
+    return default_client().trending(geo, realtime, no_cache)
@@ -0,0 +1,134 @@
+"""Cache prewarming from a watchlist file."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import yaml
+
+from trends_cli.api.cache import CACHE_TTL, cache_age, cache_prefetch
+from trends_cli.api.trends import (
+    TrendsClient,
+    default_client,
+    interest_cache_key,
+    related_cache_key,
+)
+from trends_cli.display.format import CLI_TO_PYTRENDS
+
+
+@dataclass
+class WarmJob:
+    kind: str            # "interest" or "related"
+    queries: list[str]
+    timeframe: str       # pytrends timeframe, e.g. "today 5-y"
+    geo: str
+    priority: int = 0
+
+    @property
+    def key(self) -> str:
+        if self.kind == "related":
+            return related_cache_key(self.queries[0], self.geo)
+        return interest_cache_key(self.queries, self.timeframe, self.geo)
+
+    @property
+    def label(self) -> str:
+        terms = ", ".join(self.queries)
+        if self.kind == "related":
+            return f"related {terms} [{self.geo or 'WW'}]"
+        return f"{terms} [{self.timeframe}, {self.geo or 'WW'}]"
+
+
+def load_watchlist(path: Path) -> list[WarmJob]:
+    """Parse a watchlist file into warm jobs.
+
+    Format::
+
+        defaults:
+          timeframe: 5y
+          geo: US
+        terms:
+          - bitcoin
+          - query: ethereum
+            timeframe: 1y
+            priority: 10
+            related: true
+          - queries: [python, javascript]
+
+    Raises ValueError on malformed entries.
+    """
+    with open(path) as f:
+        doc = yaml.safe_load(f) or {}
+
+    if isinstance(doc, list):
+        doc = {"terms": doc}
+    defaults = doc.get("defaults") or {}
+    jobs: list[WarmJob] = []
+    seen: set[str] = set()
+
+    for n, entry in enumerate(doc.get("terms") or [], 1):
+        if isinstance(entry, str):
+            entry = {"query": entry}
+        if not isinstance(entry, dict):
+            raise ValueError(f"entry {n}: expected a term or a mapping")
+
+        opts = {**defaults, **entry}
+        queries = opts.get("queries") or ([opts["query"]] if opts.get("query") else [])
+        if not queries or len(queries) > 5:
+            raise ValueError(f"entry {n}: give 1–5 queries")
+        queries = [str(q) for q in queries]
+
+        tf = str(opts.get("timeframe", "5y"))
+        if tf not in CLI_TO_PYTRENDS:
+            raise ValueError(f"entry {n}: invalid timeframe {tf!r}")
+        geo = str(opts.get("geo", "US"))
+        priority = int(opts.get("priority", 0))
+
+        candidates = [WarmJob("interest", queries, CLI_TO_PYTRENDS[tf], geo, priority)]
+        if opts.get("related"):
+            candidates += [WarmJob("related", [q], "today 12-m", geo, priority) for q in queries]
+
+        for job in candidates:
+            if job.key not in seen:
+                seen.add(job.key)
+                jobs.append(job)
+
+    return jobs
+
+
+def due_jobs(jobs: list[WarmJob], ahead: float) -> list[WarmJob]:
+    """Jobs whose entry is missing or expires within `ahead` seconds.
+
+    Ordered by priority (highest first), then by remaining lifetime so the
+    entries closest to expiry are refreshed first. Entries refreshed by an
+    earlier, interrupted run are still fresh and drop out — that is what
+    makes a re-run resume where it stopped.
+    """
+    # Entries another host already fetched count as fresh
+    cache_prefetch([job.key for job in jobs])
+
+    due: list[tuple[WarmJob, float]] = []
+    for job in jobs:
+        age = cache_age(job.key)
+        remaining = -1.0 if age is None else CACHE_TTL - age
+        if remaining <= ahead:
+            due.append((job, remaining))
+    due.sort(key=lambda jr: (-jr[0].priority, jr[1]))
+    return [job for job, _ in due]
+
+
+def run_job(job: WarmJob, client: TrendsClient | None = None) -> None:
+    """Fetch a job from the network and write it through to the cache. Raises FetchError."""
+    client = client or default_client()
+    if job.kind == "related":
+        client.related(job.queries[0], job.geo, no_cache=True)
+    else:
+        client.interest(job.queries, job.timeframe, job.geo, no_cache=True)
+
+
+def coverage(jobs: list[WarmJob]) -> int:
+    """Number of jobs currently served by a fresh cache entry."""
+    fresh = 0
+    for job in jobs:
+        age = cache_age(job.key)
+        if age is not None and age <= CACHE_TTL:
+            fresh += 1
+    return fresh
@@ -0,0 +1,30 @@
+"""Term list input shared by the many-term commands (scan, dashboard, correlate)."""
+
+from pathlib import Path
+
+import typer
+
+from trends_cli.display.tables import console
+
+
+def load_terms(queries: list[str] | None, file: Path | None, min_terms: int = 1) -> list[str]:
+    """Terms from arguments plus --file (one per line, # comments), deduplicated in order.
+
+    Prints an error and exits if the file cannot be read or fewer than
+    min_terms remain.
+    """
+    terms = list(queries or [])
+    if file is not None:
+        try:
+            with open(file) as f:
+                terms += [ln.strip() for ln in f if ln.strip() and not ln.lstrip().startswith("#")]
+        except OSError as e:
+            console.print(f"[red]Cannot read {file}:[/red] {e}")
+            raise typer.Exit(1)
+    terms = list(dict.fromkeys(terms))
+
+    if len(terms) < min_terms:
+        need = "terms" if min_terms <= 1 else f"at least {min_terms} terms"
+        console.print(f"[red]Provide {need} as arguments or with --file.[/red]")
+        raise typer.Exit(1)
+    return terms
@@ -0,0 +1,129 @@
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from trends_cli.api.cache import cache_stats, prune as prune_cache, verify as verify_cache
+from trends_cli.api.trends import default_client
+from trends_cli.api.warm import coverage, due_jobs, load_watchlist, run_job
+from trends_cli.display.tables import (
+    render_cache_maintenance,
+    render_cache_stats,
+    render_warm_report,
+    console,
+)
+
+app = typer.Typer(no_args_is_help=True)
+
+
+@app.command("warm")
+def warm(
+    watchlist: Annotated[Path, typer.Option("--watchlist", "-w", help="YAML watchlist of terms to prewarm")],
+    window: Annotated[float, typer.Option("--window", help="Spread requests over this many seconds")] = 0.0,
+    min_interval: Annotated[float, typer.Option("--min-interval", help="Minimum seconds between requests")] = 2.0,
+    ahead: Annotated[float, typer.Option("--ahead", help="Refresh entries expiring within this many seconds")] = 60.0,
+    fmt: Annotated[str, typer.Option("--format", help="table or json")] = "table",
+) -> None:
+    """Refresh watchlist entries ahead of expiry so interactive use sees cache hits."""
+
+    try:
+        jobs = load_watchlist(watchlist)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Invalid watchlist:[/red] {e}")
+        raise typer.Exit(1)
+
+    due = due_jobs(jobs, ahead)
+    fresh_before = len(jobs) - len(due)
+    interval = max(min_interval, window / len(due)) if due else 0.0
+
+    refreshed = 0
+    failed: list[dict] = []
+    backoff = 0.0
+    started = time.monotonic()
+
+    try:
+        with console.status("[dim]Warming cache…[/dim]", spinner="dots") as status:
+            for i, job in enumerate(due, 1):
+                status.update(f"[dim]Warming {i}/{len(due)}: {job.label}…[/dim]")
+                t0 = time.monotonic()
+                try:
+                    run_job(job)
+                    refreshed += 1
+                    backoff = 0.0
+                except Exception as e:
+                    failed.append({"job": job.label, "error": str(e)})
+                    # Back off on consecutive failures — usually a 429
+                    backoff = min(max(backoff * 2, interval), 600.0)
+                if i < len(due):
+                    time.sleep(max(0.0, interval + backoff - (time.monotonic() - t0)))
+    except KeyboardInterrupt:
+        console.print("[yellow]Interrupted — re-run to resume.[/yellow]")
+
+    report = {
+        "jobs":         len(jobs),
+        "fresh_before": fresh_before,
+        "refreshed":    refreshed,
+        "failed":       failed,
+        "fresh_after":  coverage(jobs),
+        "elapsed_s":    round(time.monotonic() - started, 1),
+        "proxies":      default_client().proxy_stats(),
+    }
+
+    if fmt == "json" or not sys.stdout.isatty():
+        print(json.dumps(report, indent=2))
+    else:
+        render_warm_report(report)
+
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command("stats")
+def stats(
+    fmt: Annotated[str, typer.Option("--format", help="table or json")] = "table",
+) -> None:
+    """Entries, size, hit ratio and age histogram by endpoint."""
+
+    with console.status("[dim]Scanning cache…[/dim]", spinner="dots"):
+        data = cache_stats()
+
+    if fmt == "json" or not sys.stdout.isatty():
+        print(json.dumps(data, indent=2))
+    else:
+        render_cache_stats(data)
+
+
+@app.command("prune")
+def prune(
+    max_bytes: Annotated[int | None, typer.Option("--max-bytes", help="Size budget (default: $TRENDS_CACHE_MAX_BYTES)")] = None,
+    dry_run: Annotated[bool, typer.Option("--dry-run", help="Report what would be removed")] = False,
+    fmt: Annotated[str, typer.Option("--format", help="table or json")] = "table",
+) -> None:
+    """Remove expired entries, then least-recently-used ones until under budget."""
+
+    with console.status("[dim]Pruning cache…[/dim]", spinner="dots"):
+        result = prune_cache(max_bytes, dry_run)
+
+    if fmt == "json" or not sys.stdout.isatty():
+        print(json.dumps(result, indent=2))
+    else:
+        render_cache_maintenance("CACHE PRUNE", result)
+
+
+@app.command("verify")
+def verify(
+    dry_run: Annotated[bool, typer.Option("--dry-run", help="Report corrupt entries without removing them")] = False,
+    fmt: Annotated[str, typer.Option("--format", help="table or json")] = "table",
+) -> None:
+    """Detect and remove corrupt or partially written entries."""
+
+    with console.status("[dim]Verifying cache…[/dim]", spinner="dots"):
+        result = verify_cache(dry_run)
+
+    if fmt == "json" or not sys.stdout.isatty():
+        print(json.dumps(result, indent=2))
+    else:
+        render_cache_maintenance("CACHE VERIFY", {k: v for k, v in result.items() if k != "removed"})
@@ -0,0 +1,90 @@
+import csv
+import json
+import sys
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+from trends_cli.api.correlate import iter_pairs, load_aligned, top_similar
+from trends_cli.api.trends import TrendsClient
+from trends_cli.commands._terms import load_terms
+from trends_cli.display.format import MULTI_DAY_TIMEFRAMES, cli_to_pytrends
+from trends_cli.display.tables import render_correlations, console
+
+app = typer.Typer()
+
+
+@app.callback(invoke_without_command=True)
+def correlate(
+    queries: Annotated[Optional[list[str]], typer.Argument(help="Search terms to correlate")] = None,
+    file: Annotated[Optional[Path], typer.Option("--file", "-f", help="Text file with one term per line")] = None,
+    timeframe: Annotated[str, typer.Option("--timeframe", "-t", help="7d 1m 3m 1y 5y 10y")] = "1y",
+    geo: Annotated[str, typer.Option("--geo", "-g", help="Country code, e.g. US, GB")] = "US",
+    query: Annotated[Optional[list[str]], typer.Option("--query", "-q", help="Only list matches for this term (repeatable)")] = None,
+    top: Annotated[int, typer.Option("--top", "-k", help="Most similar terms per query")] = 5,
+    max_lag: Annotated[int, typer.Option("--max-lag", help="Also try shifting series up to this many points")] = 0,
+    min_corr: Annotated[float, typer.Option("--min-corr", help="Drop pairs below this correlation")] = -1.0,
+    matrix: Annotated[bool, typer.Option("--matrix", help="Write every pair as CSV (query,other,corr,lag)")] = False,
+    output: Annotated[Optional[Path], typer.Option("--output", "-o", help="CSV file for --matrix (default stdout)")] = None,
+    workers: Annotated[int, typer.Option("--workers", "-w", help="Concurrent fetches")] = 8,
+    cached_only: Annotated[bool, typer.Option("--cached-only", help="Skip terms that are not cached instead of fetching")] = False,
+    fmt: Annotated[str, typer.Option("--format", help="table or json")] = "table",
+) -> None:
+    """Find the most similar terms by correlation of their interest over time."""
+
+    terms = load_terms(list(queries or []) + list(query or []), file, min_terms=2)
+
+    if timeframe not in MULTI_DAY_TIMEFRAMES:
+        console.print(f"[red]Invalid timeframe:[/red] {timeframe}. Choose from: {', '.join(MULTI_DAY_TIMEFRAMES)}")
+        raise typer.Exit(1)
+
+    tf = cli_to_pytrends(timeframe)
+
+    with TrendsClient.from_env(workers=workers, cache_only=cached_only) as client:
+        with console.status(f"[dim]Loading {len(terms):,} series…[/dim]", spinner="dots"):
+            found, dates, grid = load_aligned(terms, tf, geo, client)
+
+    if len(found) < 2:
+        console.print("[yellow]Need data for at least 2 terms.[/yellow]")
+        raise typer.Exit(1)
+
+    if matrix:
+        f = open(output, "w", newline="") if output is not None else sys.stdout
+        try:
+            w = csv.writer(f)
+            w.writerow(["query", "other", "corr", "lag"])
+            for c in iter_pairs(found, grid, max_lag, min_corr):
+                w.writerow([c.query, c.other, c.corr, c.lag])
+        finally:
+            if output is not None:
+                f.close()
+        return
+
+    targets = [q for q in dict.fromkeys(query or []) if q in found] if query else None
+    if query and not targets:
+        console.print("[yellow]No data for any --query term.[/yellow]")
+        raise typer.Exit(1)
+
+    with console.status("[dim]Correlating…[/dim]", spinner="dots"):
+        results = top_similar(found, grid, top, max_lag, targets, min_corr)
+
+    if fmt == "json" or not sys.stdout.isatty():
+        out = {
+            "timeframe": tf,
+            "geo":       geo,
+            "terms":     len(found),
+            "missing":   [t for t in terms if t not in found],
+            "points":    len(dates),
+            "max_lag":   max_lag,
+            "results": [
+                {
+                    "query":   q,
+                    "similar": [{"query": c.other, "corr": c.corr, "lag": c.lag} for c in similar],
+                }
+                for q, similar in results.items()
+            ],
+        }
+        print(json.dumps(out, indent=2))
+    else:
+        render_correlations(tf, geo, results, len(found), len(terms) - len(found), max_lag)
@@ -0,0 +1,75 @@
+import json
+import sys
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+from trends_cli.api.trends import NotCached, TrendsClient
+from trends_cli.commands._terms import load_terms
+from trends_cli.display.chart import render_dashboard, console
+from trends_cli.display.format import VALID_TIMEFRAMES, cli_to_pytrends
+
+app = typer.Typer()
+
+
+@app.callback(invoke_without_command=True)
+def dashboard(
+    queries: Annotated[Optional[list[str]], typer.Argument(help="Search terms to chart")] = None,
+    file: Annotated[Optional[Path], typer.Option("--file", "-f", help="Text file with one term per line")] = None,
+    timeframe: Annotated[str, typer.Option("--timeframe", "-t", help="1h 4h 1d 7d 1m 3m 1y 5y 10y")] = "1y",
+    geo: Annotated[str, typer.Option("--geo", "-g", help="Country code, e.g. US, GB")] = "US",
+    sparklines: Annotated[bool, typer.Option("--sparklines", "-s", help="One line per term instead of small charts")] = False,
+    cols: Annotated[int, typer.Option("--cols", help="Grid columns (default: fit terminal width)")] = 0,
+    height: Annotated[int, typer.Option("--height", help="Rows per chart")] = 4,
+    workers: Annotated[int, typer.Option("--workers", "-w", help="Concurrent fetches")] = 8,
+    cached_only: Annotated[bool, typer.Option("--cached-only", help="Skip terms that are not cached instead of fetching")] = False,
+    fmt: Annotated[str, typer.Option("--format", help="chart or json")] = "chart",
+) -> None:
+    """Show many terms at once as a grid of small charts or sparklines."""
+
+    terms = load_terms(queries, file)
+
+    if timeframe not in VALID_TIMEFRAMES:
+        console.print(f"[red]Invalid timeframe:[/red] {timeframe}. Choose from: {', '.join(VALID_TIMEFRAMES)}")
+        raise typer.Exit(1)
+
+    tf = cli_to_pytrends(timeframe)
+
+    found = {}
+    failed: dict[str, str] = {}
+    with TrendsClient.from_env(workers=workers, cache_only=cached_only) as client:
+        with console.status(f"[dim]Fetching {len(terms):,} terms…[/dim]", spinner="dots"):
+            for r in client.interest_many(terms, tf, geo):
+                if r.value:
+                    found[r.queries[0]] = r.value[0]
+                elif r.error is not None and not isinstance(r.error, NotCached):
+                    failed[r.queries[0]] = str(r.error)
+
+    series_list = [found[t] for t in terms if t in found]
+    missing = [t for t in terms if t not in found and t not in failed]
+
+    if fmt == "json" or not sys.stdout.isatty():
+        out = {
+            "timeframe": tf,
+            "geo":       geo,
+            "missing":   missing,
+            "failed":    [{"query": q, "error": e} for q, e in failed.items()],
+            "series": [
+                {
+                    "query":         s.query,
+                    "current_value": s.current_value,
+                    "avg_value":     s.avg_value,
+                    "peak_value":    s.peak_value,
+                    "peak_date":     s.peak_date,
+                    "series":        [{"date": dp.date, "value": dp.value} for dp in s.series],
+                }
+                for s in series_list
+            ],
+        }
+        print(json.dumps(out, indent=2))
+    else:
+        if not series_list:
+            console.print("[yellow]No data for any term.[/yellow]")
+            raise typer.Exit(1)
+        render_dashboard(series_list, missing, sparklines, cols, max(1, height), list(failed))
@@ -0,0 +1,30 @@
+import json
+import sys
+from typing import Annotated
+
+import typer
+
+from trends_cli.api.trends import default_client
+from trends_cli.display.tables import render_proxy_stats, console
+
+app = typer.Typer()
+
+
+@app.callback(invoke_without_command=True)
+def proxies(
+    rounds: Annotated[int, typer.Option("--rounds", "-r", help="Probe requests per proxy")] = 1,
+    fmt: Annotated[str, typer.Option("--format", help="table or json")] = "table",
+) -> None:
+    """Probe the configured egress proxies and show per-proxy health."""
+
+    with console.status("[dim]Probing proxies…[/dim]", spinner="dots"):
+        stats = default_client().probe_proxies(rounds)
+
+    if not stats:
+        console.print("[yellow]No proxies configured.[/yellow] Set TRENDS_PROXIES, e.g. \"direct,http://10.0.0.2:3128\".")
+        raise typer.Exit(1)
+
+    if fmt == "json" or not sys.stdout.isatty():
+        print(json.dumps(stats, indent=2))
+    else:
+        render_proxy_stats(stats)
@@ -0,0 +1,59 @@
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from trends_cli.api.queue import QUEUE_PATH, JobQueue
+from trends_cli.api.warm import load_watchlist
+from trends_cli.display.tables import render_queue_progress, console
+
+app = typer.Typer(no_args_is_help=True)
+
+
+@app.command("enqueue")
+def enqueue(
+    watchlist: Annotated[Path, typer.Option("--watchlist", "-w", help="YAML watchlist of terms to fetch")],
+    queue: Annotated[Path, typer.Option("--queue", "-q", help="Queue file (default: $TRENDS_QUEUE)")] = QUEUE_PATH,
+) -> None:
+    """Add watchlist jobs to the shared queue (finished ones are re-armed)."""
+
+    try:
+        jobs = load_watchlist(watchlist)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Invalid watchlist:[/red] {e}")
+        raise typer.Exit(1)
+
+    q = JobQueue(queue)
+    try:
+        n = q.enqueue(jobs)
+    finally:
+        q.close()
+    console.print(f"[green]Enqueued[/green] {n} of {len(jobs)} jobs [dim]→ {queue}[/dim]")
+
+
+@app.command("status")
+def status(
+    queue: Annotated[Path, typer.Option("--queue", "-q", help="Queue file (default: $TRENDS_QUEUE)")] = QUEUE_PATH,
+    watch: Annotated[float, typer.Option("--watch", help="Refresh every N seconds until the queue drains")] = 0.0,
+    fmt: Annotated[str, typer.Option("--format", help="table or json")] = "table",
+) -> None:
+    """Show queue progress, throughput and ETA."""
+
+    q = JobQueue(queue)
+    try:
+        while True:
+            data = q.progress()
+            if fmt == "json" or not sys.stdout.isatty():
+                print(json.dumps(data, indent=2))
+            else:
+                render_queue_progress(data)
+            if not watch or data["pending"] + data["running"] == 0:
+                break
+            time.sleep(watch)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        q.close()
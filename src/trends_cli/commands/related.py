@@ -4,7 +4,7 @@ from typing import Annotated
 
 import typer
 
-from trends_cli.api.trends import fetch_related
+from trends_cli.api.trends import FetchError, default_client
 from trends_cli.display.tables import render_related, console
 
 app = typer.Typer()
@@ -20,8 +20,12 @@ def related(
 ) -> None:
     """Show related queries and topics for a search term."""
 
-    with console.status(f"[dim]Fetching related \"{query}\"…[/dim]", spinner="dots"):
-        data = fetch_related(query, geo, no_cache)
+    try:
+        with console.status(f"[dim]Fetching related \"{query}\"…[/dim]", spinner="dots"):
+            data = default_client().related(query, geo, no_cache)
+    except FetchError as e:
+        console.print(f"[red]Request failed:[/red] {e}")
+        raise typer.Exit(1)
 
     if fmt == "json" or not sys.stdout.isatty():
         out = {
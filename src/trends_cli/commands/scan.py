@@ -0,0 +1,75 @@
+import json
+import sys
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+from trends_cli.api.scan import load_matrix, scan_matrix
+from trends_cli.api.trends import TrendsClient
+from trends_cli.commands._terms import load_terms
+from trends_cli.display.format import MULTI_DAY_TIMEFRAMES, cli_to_pytrends
+from trends_cli.display.tables import render_scan, console
+
+app = typer.Typer()
+
+
+@app.callback(invoke_without_command=True)
+def scan(
+    queries: Annotated[Optional[list[str]], typer.Argument(help="Search terms to scan")] = None,
+    file: Annotated[Optional[Path], typer.Option("--file", "-f", help="Text file with one term per line")] = None,
+    timeframe: Annotated[str, typer.Option("--timeframe", "-t", help="7d 1m 3m 1y 5y 10y")] = "3m",
+    geo: Annotated[str, typer.Option("--geo", "-g", help="Country code, e.g. US, GB")] = "US",
+    window: Annotated[int, typer.Option("--window", "-w", help="Trailing points for the z-score baseline")] = 12,
+    z: Annotated[float, typer.Option("--z", help="Z-score threshold for a breakout")] = 3.0,
+    top: Annotated[int, typer.Option("--top", "-n", help="Rows to show")] = 20,
+    breakouts_only: Annotated[bool, typer.Option("--breakouts", help="Only show flagged breakouts")] = False,
+    workers: Annotated[int, typer.Option("--workers", help="Concurrent fetches")] = 8,
+    cached_only: Annotated[bool, typer.Option("--cached-only", help="Skip terms that are not cached instead of fetching")] = False,
+    fmt: Annotated[str, typer.Option("--format", help="table or json")] = "table",
+) -> None:
+    """Rank many terms by spike z-score and week-over-week change."""
+
+    terms = load_terms(queries, file)
+
+    if timeframe not in MULTI_DAY_TIMEFRAMES:
+        console.print(f"[red]Invalid timeframe:[/red] {timeframe}. Choose from: {', '.join(MULTI_DAY_TIMEFRAMES)}")
+        raise typer.Exit(1)
+
+    tf = cli_to_pytrends(timeframe)
+
+    with TrendsClient.from_env(workers=workers, cache_only=cached_only) as client:
+        with console.status(f"[dim]Loading {len(terms):,} series…[/dim]", spinner="dots"):
+            found, dates, matrix = load_matrix(terms, tf, geo, client)
+            results = scan_matrix(found, matrix, tf, window, z)
+
+    if breakouts_only:
+        results = [r for r in results if r.breakout]
+    shown = results[:top]
+
+    if fmt == "json" or not sys.stdout.isatty():
+        out = {
+            "timeframe": tf,
+            "geo":       geo,
+            "scanned":   len(found),
+            "missing":   len(terms) - len(found),
+            "as_of":     dates[-1] if dates else None,
+            "results": [
+                {
+                    "query":         r.query,
+                    "current_value": r.current_value,
+                    "avg_value":     r.avg_value,
+                    "peak_value":    r.peak_value,
+                    "zscore":        r.zscore,
+                    "wow_change":    r.wow_change,
+                    "breakout":      r.breakout,
+                }
+                for r in shown
+            ],
+        }
+        print(json.dumps(out, indent=2))
+    else:
+        if not found:
+            console.print("[yellow]No data for any term.[/yellow]")
+            raise typer.Exit(1)
+        render_scan(tf, geo, shown, len(found), len(terms) - len(found), dates[-1] if dates else "")
@@ -4,14 +4,13 @@ from typing import Annotated
 
 import typer
 
-from trends_cli.api.trends import fetch_interest
+from trends_cli.api.planner import fetch_interest_planned
+from trends_cli.api.trends import FetchError, default_client
 from trends_cli.display.chart import render_search_chart, console
-from trends_cli.display.format import cli_to_pytrends
+from trends_cli.display.format import VALID_TIMEFRAMES, cli_to_pytrends
 
 app = typer.Typer()
 
-VALID_TIMEFRAMES = ["1h", "4h", "1d", "7d", "1m", "3m", "1y", "5y", "10y"]
-
 
 @app.callback(invoke_without_command=True)
 def search(
@@ -20,6 +19,7 @@ def search(
     geo: Annotated[str, typer.Option("--geo", "-g", help="Country code, e.g. US, GB")] = "US",
     fmt: Annotated[str, typer.Option("--format", help="chart or json")] = "chart",
     no_cache: Annotated[bool, typer.Option("--no-cache", help="Bypass 5-min cache")] = False,
+    derive: Annotated[bool, typer.Option("--derive", help="Slice from a cached longer timeframe when possible")] = False,
 ) -> None:
     """Plot Google Trends interest over time for a search term."""
 
@@ -29,8 +29,16 @@ def search(
 
     tf = cli_to_pytrends(timeframe)
 
-    with console.status(f"[dim]Fetching \"{query}\"…[/dim]", spinner="dots"):
-        series_list = fetch_interest([query], tf, geo, no_cache)
+    client = default_client()
+    try:
+        with console.status(f"[dim]Fetching \"{query}\"…[/dim]", spinner="dots"):
+            if derive:
+                series_list = fetch_interest_planned([query], tf, geo, no_cache, client)
+            else:
+                series_list = client.interest([query], tf, geo, no_cache)
+    except FetchError as e:
+        console.print(f"[red]Request failed:[/red] {e}")
+        raise typer.Exit(1)
 
     if not series_list:
         console.print(f"[yellow]No data returned for:[/yellow] {query}")
@@ -48,6 +56,7 @@ def search(
             "peak_date":     series.peak_date,
             "current_value": series.current_value,
             "avg_value":     series.avg_value,
+            "derived_from":  series.derived_from or None,
             "series":        [{"date": dp.date, "value": dp.value} for dp in series.series],
         }
         print(json.dumps(out, indent=2))
@@ -4,7 +4,7 @@ from typing import Annotated
 
 import typer
 
-from trends_cli.api.trends import fetch_trending
+from trends_cli.api.trends import FetchError, default_client
 from trends_cli.display.tables import render_trending, console
 
 app = typer.Typer()
@@ -21,8 +21,12 @@ def trending(
     """Show today's trending searches."""
 
     label = "realtime trending" if realtime else "trending searches"
-    with console.status(f"[dim]Fetching {label}…[/dim]", spinner="dots"):
-        searches = fetch_trending(geo, realtime, no_cache)
+    try:
+        with console.status(f"[dim]Fetching {label}…[/dim]", spinner="dots"):
+            searches = default_client().trending(geo, realtime, no_cache)
+    except FetchError as e:
+        console.print(f"[red]Request failed:[/red] {e}")
+        raise typer.Exit(1)
 
     searches = searches[:limit]
 
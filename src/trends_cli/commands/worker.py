@@ -0,0 +1,53 @@
+import multiprocessing
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+from trends_cli.api.queue import QUEUE_PATH, run_worker
+from trends_cli.display.tables import console
+
+app = typer.Typer()
+
+
+@app.callback(invoke_without_command=True)
+def worker(
+    queue: Annotated[Path, typer.Option("--queue", "-q", help="Queue file (default: $TRENDS_QUEUE)")] = QUEUE_PATH,
+    processes: Annotated[int, typer.Option("--processes", "-p", help="Worker processes on this host")] = 1,
+    min_interval: Annotated[float, typer.Option("--min-interval", help="Minimum seconds between requests per process")] = 2.0,
+    exit_when_empty: Annotated[bool, typer.Option("--exit-when-empty", help="Stop once no jobs are left")] = False,
+) -> None:
+    """Pull fetch jobs from the shared queue and write results into the cache."""
+
+    if processes < 1:
+        console.print("[red]--processes must be at least 1[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"[dim]Worker: {processes} process(es) on {queue}[/dim]")
+    if processes == 1:
+        try:
+            done = run_worker(queue, min_interval, exit_when_empty)
+        except KeyboardInterrupt:
+            raise typer.Exit(130)
+        console.print(f"[green]Done:[/green] {done} jobs")
+        return
+
+    procs = [
+        multiprocessing.Process(
+            target=run_worker,
+            args=(queue, min_interval, exit_when_empty),
+            kwargs={"processes": processes},
+            daemon=True,
+        )
+        for _ in range(processes)
+    ]
+    for p in procs:
+        p.start()
+    try:
+        for p in procs:
+            p.join()
+    except KeyboardInterrupt:
+        # Leased jobs of killed workers become claimable once their lease expires
+        for p in procs:
+            p.terminate()
+        raise typer.Exit(130)
@@ -1,8 +1,12 @@
 """Smooth braille chart renderer — no plotext, pure Rich output."""
 
+import hashlib
+from array import array
+from collections import OrderedDict
 from datetime import datetime
+from itertools import groupby
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.rule import Rule
 from rich.text import Text
 
@@ -31,6 +35,14 @@ _BITS = [
 _CHART_H = 18  # character rows (= 72 pixel rows)
 _Y_AXIS_W = 5  # chars reserved for "  100"
 
+_DASH_GAP = 3             # spaces between dashboard cells
+_DASH_MIN_CELL_W = 28     # narrowest chart cell before dropping a column
+_SPARK_MIN_CELL_W = 36    # narrowest sparkline cell
+_SPARK_LABEL_W = 16
+
+_RASTER_CACHE_SIZE = 256  # memoized chart rasters; enough for a 100+ term dashboard
+_raster_cache: OrderedDict[tuple, list[Text]] = OrderedDict()
+
 
 # ---------------------------------------------------------------------------
 # Core braille renderer
@@ -52,6 +64,47 @@ def _interp(values: list[float], px_w: int) -> list[float]:
     return out
 
 
+def _column_spans(values: list[float], px_w: int) -> list[tuple[float, float]]:
+    """(low, high) value drawn in each of px_w pixel columns.
+
+    With more points than columns, each column is the min/max of the points
+    that fall in it (one linear pass), so narrow spikes and the true peak
+    survive. With fewer, points are linearly interpolated and each point is
+    also pinned to its nearest column. Either way each
+    span is widened to meet the previous column's last value so steep
+    segments draw as a connected vertical stroke instead of breaking up.
+    """
+    n = len(values)
+    if n <= px_w:
+        lasts = _interp(values, px_w)
+        lows, highs = lasts[:], lasts[:]
+        # Interpolation only samples between points; pin each point to its
+        # nearest column so the exact peak is always drawn
+        if n > 1:
+            for i, v in enumerate(values):
+                col = round(i * (px_w - 1) / (n - 1))
+                lows[col] = min(lows[col], v)
+                highs[col] = max(highs[col], v)
+    else:
+        lows  = [float("inf")] * px_w
+        highs = [float("-inf")] * px_w
+        lasts = [0.0] * px_w
+        for i, v in enumerate(values):
+            col = i * px_w // n
+            if v < lows[col]:
+                lows[col] = v
+            if v > highs[col]:
+                highs[col] = v
+            lasts[col] = v
+
+    spans = []
+    prev_last = float(values[0]) if n else 0.0
+    for x in range(px_w):
+        spans.append((min(lows[x], prev_last), max(highs[x], prev_last)))
+        prev_last = lasts[x]
+    return spans
+
+
 def _val_to_px_row(v: float, px_h: int, y_max: float = 100.0) -> int:
     """Map a 0–y_max value to a pixel row (0 = top, px_h-1 = bottom)."""
     p = max(0.0, min(1.0, v / y_max))
@@ -63,6 +116,7 @@ def _render_series(
     colors: list[str],
     char_w: int,
     char_h: int,
+    fill: bool = True,
 ) -> list[Text]:
     """
     Render one or more data series as a filled braille chart.
@@ -71,6 +125,7 @@ def _render_series(
     Each braille cell is 2px wide × 4px tall.
     Line pixels are styled bold <color>; fill pixels dim <color>.
     Series rendered in reverse order so series[0] appears on top.
+    fill=False draws the line only (sparklines).
     """
     px_w = char_w * 2
     px_h = char_h * 4
@@ -82,23 +137,25 @@ def _render_series(
     ]
 
     for s_idx in reversed(range(len(all_values))):
-        px_cols = _interp(all_values[s_idx], px_w)
-        for px_x, v in enumerate(px_cols):
-            y_row = _val_to_px_row(v, px_h)
+        spans = _column_spans(all_values[s_idx], px_w)
+        for px_x, (lo, hi) in enumerate(spans):
+            top_row = _val_to_px_row(hi, px_h)
+            bot_row = _val_to_px_row(lo, px_h)
 
-            # Line pixel — never overwrite another series' line
-            if grid[y_row][px_x] is None or grid[y_row][px_x][0] == 0:
-                grid[y_row][px_x] = (1, s_idx)
+            # Line pixels — vertical span; never overwrite another series' line
+            for r in range(top_row, bot_row + 1):
+                if grid[r][px_x] is None or grid[r][px_x][0] == 0:
+                    grid[r][px_x] = (1, s_idx)
 
             # Fill below the line
-            for r in range(y_row + 1, px_h):
+            for r in range(bot_row + 1, px_h if fill else 0):
                 if grid[r][px_x] is None:
                     grid[r][px_x] = (0, s_idx)
 
     # Convert pixel grid → Rich Text rows
     rows: list[Text] = []
     for cy in range(char_h):
-        text = Text()
+        cells: list[tuple[str, str | None]] = []
         for cx in range(char_w):
             # Accumulate bits per (kind, series_idx)
             buckets: dict[tuple[int, int], int] = {}
@@ -109,7 +166,7 @@ def _render_series(
                         buckets[cell] = buckets.get(cell, 0) | _BITS[sr][sc]
 
             if not buckets:
-                text.append(" ")
+                cells.append((" ", None))
             else:
                 # Dominant bucket: line (kind=1) beats fill (kind=0);
                 # lower series index wins ties.
@@ -122,12 +179,46 @@ def _render_series(
                 kind, s_idx = dominant
                 color = colors[s_idx % len(colors)]
                 style = f"bold {color}" if kind == 1 else f"dim {color}"
-                text.append(char, style=style)
+                cells.append((char, style))
 
+        # One span per run of same-styled cells rather than one per cell
+        text = Text()
+        for style, run in groupby(cells, key=lambda c: c[1]):
+            text.append("".join(ch for ch, _ in run), style=style)
         rows.append(text)
     return rows
 
 
+def _rasterize(
+    all_values: list[list[float]],
+    colors: list[str],
+    char_w: int,
+    char_h: int,
+    fill: bool = True,
+) -> list[Text]:
+    """_render_series, memoized on (values hash, width, height, colors).
+
+    Watch loops and repeated lookups redraw the same cached payload at the same
+    terminal size; those redraws skip rasterization entirely. The returned
+    rows are shared between calls and must not be modified.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for values in all_values:
+        h.update(len(values).to_bytes(8, "little"))
+        h.update(array("d", values).tobytes())
+    key = (h.digest(), char_w, char_h, tuple(colors), fill)
+
+    rows = _raster_cache.get(key)
+    if rows is None:
+        rows = _render_series(all_values, colors, char_w, char_h, fill)
+        _raster_cache[key] = rows
+        if len(_raster_cache) > _RASTER_CACHE_SIZE:
+            _raster_cache.popitem(last=False)
+    else:
+        _raster_cache.move_to_end(key)
+    return rows
+
+
 # ---------------------------------------------------------------------------
 # Axis helpers
 # ---------------------------------------------------------------------------
@@ -175,29 +266,33 @@ def _x_label_str(dates: list[str], char_w: int, timeframe: str, n: int = 5) -> s
 
 
 # ---------------------------------------------------------------------------
-# Print chart with axes
+# Chart block with axes
 # ---------------------------------------------------------------------------
 
-def _print_chart_block(
+def _chart_block(
     rows: list[Text],
     dates: list[str],
     timeframe: str,
     char_w: int,
     char_h: int,
-) -> None:
-    """Print Y-labeled chart rows then the X-axis date line."""
+) -> Text:
+    """Y-labeled chart rows then the X-axis date line, as one Text."""
     y_labels = _y_label_rows(char_h)
 
+    lines: list[Text] = []
     for row_idx, row_text in enumerate(rows):
         label = y_labels.get(row_idx, "")
         line = Text()
         line.append(label.rjust(_Y_AXIS_W), style="dim")
         line.append(" ")
         line.append_text(row_text)
-        console.print(line)
+        lines.append(line)
 
     x_str = _x_label_str(dates, char_w, timeframe)
-    console.print(Text(" " * (_Y_AXIS_W + 1) + x_str, style="dim"))
+    lines.append(Text(" " * (_Y_AXIS_W + 1) + x_str, style="dim"))
+    block = Text("\n").join(lines)
+    block.no_wrap = True
+    return block
 
 
 def _chart_w() -> int:
@@ -206,6 +301,9 @@ def _chart_w() -> int:
 
 # ---------------------------------------------------------------------------
 # Public render functions
+#
+# Each builds the whole chart as one Group and prints it once, so a chart is a
+# single terminal write instead of one per row.
 # ---------------------------------------------------------------------------
 
 def render_search_chart(series: TrendSeries) -> None:
@@ -218,22 +316,25 @@ def render_search_chart(series: TrendSeries) -> None:
     title      = f'TRENDS  "{series.query.upper()}"  —  {tf_label}'
     char_w     = _chart_w()
 
-    console.print()
-    console.print(Rule(f"[bold green]{title}[/bold green]", style="green dim"))
-    console.print(f"  [dim]LAST UPDATE: {today}  │  {geo_label}  │  {date_range}[/dim]")
-    console.print()
-    console.print("  [dim]Interest Over Time[/dim]")
-    console.print()
-
-    rows = _render_series([values], ["green"], char_w, _CHART_H)
-    _print_chart_block(rows, iso_dates, series.timeframe, char_w, _CHART_H)
-
-    console.print()
-    _print_stats(series)
-    console.print("  [dim]* Interest indexed to 100 = peak popularity in window[/dim]")
-    console.print()
-    console.print(Rule(style="green dim"))
-    console.print()
+    rows = _rasterize([values], ["green"], char_w, _CHART_H)
+
+    parts: list = [
+        Text(),
+        Rule(f"[bold green]{title}[/bold green]", style="green dim"),
+        f"  [dim]LAST UPDATE: {today}  │  {geo_label}  │  {date_range}[/dim]",
+        Text(),
+        "  [dim]Interest Over Time[/dim]",
+        Text(),
+        _chart_block(rows, iso_dates, series.timeframe, char_w, _CHART_H),
+        Text(),
+        _stats_line(series),
+        "  [dim]* Interest indexed to 100 = peak popularity in window[/dim]",
+        *_derived_note(series),
+        Text(),
+        Rule(style="green dim"),
+        Text(),
+    ]
+    console.print(Group(*parts))
 
 
 def render_compare_chart(series_list: list[TrendSeries]) -> None:
@@ -250,35 +351,146 @@ def render_compare_chart(series_list: list[TrendSeries]) -> None:
     title        = f"TRENDS  {queries_lbl}  —  {tf_label}"
     char_w       = _chart_w()
 
-    console.print()
-    console.print(Rule(f"[bold green]{title}[/bold green]", style="green dim"))
-    console.print(f"  [dim]LAST UPDATE: {today}  │  {geo_label}  │  {date_range}[/dim]")
-    console.print()
-    console.print("  [dim]Interest Over Time[/dim]")
-    console.print()
-
-    rows = _render_series(all_values, COMPARE_COLORS, char_w, _CHART_H)
-    _print_chart_block(rows, iso_dates, series_list[0].timeframe, char_w, _CHART_H)
-
-    console.print()
+    rows = _rasterize(all_values, COMPARE_COLORS, char_w, _CHART_H)
+
+    parts: list = [
+        Text(),
+        Rule(f"[bold green]{title}[/bold green]", style="green dim"),
+        f"  [dim]LAST UPDATE: {today}  │  {geo_label}  │  {date_range}[/dim]",
+        Text(),
+        "  [dim]Interest Over Time[/dim]",
+        Text(),
+        _chart_block(rows, iso_dates, series_list[0].timeframe, char_w, _CHART_H),
+        Text(),
+    ]
     for i, s in enumerate(series_list):
         c        = COMPARE_COLORS[i % len(COMPARE_COLORS)]
         peak_str = f"peak: {s.peak_value} ({fmt_date(s.peak_date)})"
-        console.print(
+        parts.append(
             f"  [{c}]●[/{c}] [bold]{s.query}[/bold]"
             f"   [dim]current:[/dim] {s.current_value}"
             f"   [dim]{peak_str}[/dim]"
         )
 
-    console.print()
-    console.print("  [dim]* Interest indexed to 100 = peak popularity in window[/dim]")
-    console.print()
-    console.print(Rule(style="green dim"))
-    console.print()
+    parts += [
+        Text(),
+        "  [dim]* Interest indexed to 100 = peak popularity in window[/dim]",
+        *_derived_note(series_list[0]),
+        Text(),
+        Rule(style="green dim"),
+        Text(),
+    ]
+    console.print(Group(*parts))
 
 
-def _print_stats(series: TrendSeries) -> None:
+def render_dashboard(
+    series_list: list[TrendSeries],
+    missing: list[str],
+    sparklines: bool = False,
+    cols: int = 0,
+    char_h: int = 4,
+    failed: list[str] | None = None,
+) -> None:
+    """Lay out one small chart (or one-line sparkline) per term in a grid.
+
+    The whole board is assembled first and emitted with a single print, so a
+    hundred terms cost one terminal write rather than one per row.
+    """
+    if not series_list:
+        return
+
+    longest    = max(series_list, key=lambda s: len(s.series))
+    iso_dates  = [dp.date for dp in longest.series]
+    tf_label   = fmt_timeframe(longest.timeframe)
+    geo_label  = fmt_geo(longest.geo)
+    date_range = fmt_date_range(iso_dates)
+    today      = fmt_today()
+    title      = f"TRENDS DASHBOARD  —  {len(series_list)} TERMS  —  {tf_label}"
+
+    avail = (console.width or 120) - 2
+    if not cols:
+        min_w = _SPARK_MIN_CELL_W if sparklines else _DASH_MIN_CELL_W
+        cols = (avail + _DASH_GAP) // (min_w + _DASH_GAP)
+    cols   = max(1, min(cols, len(series_list)))
+    cell_w = max(12, (avail - _DASH_GAP * (cols - 1)) // cols)
+
+    cells = [
+        _sparkline_cell(s, cell_w) if sparklines else _dashboard_cell(s, cell_w, char_h)
+        for s in series_list
+    ]
+
+    lines: list[Text] = []
+    gap = " " * _DASH_GAP
+    for start in range(0, len(cells), cols):
+        row = cells[start:start + cols]
+        for i in range(len(row[0])):
+            line = Text("  ")
+            for j, cell in enumerate(row):
+                if j:
+                    line.append(gap)
+                line.append_text(cell[i])
+            lines.append(line)
+        if not sparklines:
+            lines.append(Text())
+    board = Text("\n").join(lines)
+    board.no_wrap = True
+
+    parts: list = [
+        Text(),
+        Rule(f"[bold green]{title}[/bold green]", style="green dim"),
+        f"  [dim]LAST UPDATE: {today}  │  {geo_label}  │  {date_range}[/dim]",
+        Text(),
+        board,
+    ]
+    if sparklines:
+        parts.append(Text())
+    parts.append("  [dim]* Each term indexed to its own peak (100) in window[/dim]")
+    if missing:
+        shown = ", ".join(missing[:8]) + (f" (+{len(missing) - 8} more)" if len(missing) > 8 else "")
+        parts.append(f"  [yellow]No data:[/yellow] [dim]{shown}[/dim]")
+    if failed:
+        shown = ", ".join(failed[:8]) + (f" (+{len(failed) - 8} more)" if len(failed) > 8 else "")
+        parts.append(f"  [red]Failed:[/red] [dim]{shown}[/dim]")
+    parts += [Text(), Rule(style="green dim"), Text()]
+    console.print(Group(*parts))
+
+
+def _fit(label: str, width: int) -> str:
+    return label if len(label) <= width else label[:width - 1] + "…"
+
+
+def _dashboard_cell(series: TrendSeries, cell_w: int, char_h: int) -> list[Text]:
+    """Title line (term + current value) over a char_h-row braille chart."""
+    values = [float(dp.value) for dp in series.series]
+    current = str(series.current_value)
+    head = Text()
+    head.append(_fit(series.query, cell_w - len(current) - 1).ljust(cell_w - len(current)), style="bold")
+    head.append(current, style="bold green")
+    return [head, *_rasterize([values], ["green"], cell_w, char_h)]
+
+
+def _sparkline_cell(series: TrendSeries, cell_w: int) -> list[Text]:
+    """One line: term, a one-row braille sparkline, current value."""
+    values  = [float(dp.value) for dp in series.series]
+    label_w = min(_SPARK_LABEL_W, cell_w // 2 - 2)
+    spark_w = cell_w - label_w - 5
+    line = Text()
+    line.append(_fit(series.query, label_w).ljust(label_w), style="bold")
+    line.append(" ")
+    line.append_text(_rasterize([values], ["green"], spark_w, 1, fill=False)[0])
+    line.append(str(series.current_value).rjust(4), style="bold green")
+    return [line]
+
+
+def _derived_note(series: TrendSeries) -> list[str]:
+    if not series.derived_from:
+        return []
+    src = fmt_timeframe(series.derived_from).removesuffix(" TREND")
+    return [f"  [dim]* Sliced from cached {src} data and re-indexed to this window[/dim]"]
+
+
+def _stats_line(series: TrendSeries) -> str:
     peak_str = f"Peak: [bold]{series.peak_value}[/bold] ({fmt_date(series.peak_date)})"
     curr_str = f"Current: [bold]{series.current_value}[/bold]"
     avg_str  = f"Avg: [bold]{series.avg_value:.0f}[/bold]"
-    console.print(f"  {peak_str}   {curr_str}   {avg_str}")
+    return f"  {peak_str}   {curr_str}   {avg_str}"
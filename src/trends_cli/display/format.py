@@ -41,6 +41,13 @@ CLI_TO_PYTRENDS = {
 }
 
 
+VALID_TIMEFRAMES = list(CLI_TO_PYTRENDS)
+
+# Timeframes of a week or more, for commands that compare a point against
+# the days or weeks before it (scan, correlate)
+MULTI_DAY_TIMEFRAMES = ["7d", "1m", "3m", "1y", "5y", "10y"]
+
+
 def cli_to_pytrends(tf: str) -> str:
     """Convert CLI timeframe flag to pytrends timeframe string."""
     return CLI_TO_PYTRENDS.get(tf, "today 5-y")
@@ -5,8 +5,8 @@ from rich.table import Table
 from rich.rule import Rule
 from rich import box
 
-from trends_cli.models import RelatedItem, TrendingSearch
-from trends_cli.display.format import fmt_geo, fmt_today
+from trends_cli.models import Correlation, RelatedItem, ScanResult, TrendingSearch
+from trends_cli.display.format import fmt_date, fmt_geo, fmt_timeframe, fmt_today
 
 console = Console()
 
@@ -98,6 +98,291 @@ def render_trending(geo: str, searches: list[TrendingSearch], realtime: bool) ->
     console.print()
 
 
+def render_scan(
+    timeframe: str,
+    geo: str,
+    results: list[ScanResult],
+    scanned: int,
+    missing: int,
+    as_of: str,
+) -> None:
+    """Render the ranked top movers of a scan."""
+    console.print()
+    console.print(
+        Rule(
+            f"[bold green]SCAN[/bold green]  [dim]{fmt_timeframe(timeframe)}  │  {fmt_geo(geo)}  │  "
+            f"as of {fmt_date(as_of)}[/dim]",
+            style="green dim",
+        )
+    )
+    console.print()
+
+    tbl = _base_table()
+    tbl.add_column("#",       style="dim", width=3, justify="right", no_wrap=True)
+    tbl.add_column("Query",   width=26, no_wrap=True)
+    tbl.add_column("Current", width=7,  justify="right", no_wrap=True)
+    tbl.add_column("Avg",     width=4,  justify="right", no_wrap=True)
+    tbl.add_column("Z",       width=5,  justify="right", no_wrap=True)
+    tbl.add_column("WoW",     width=7,  justify="right", no_wrap=True)
+    tbl.add_column("",        width=8,  no_wrap=True)
+
+    for rank, r in enumerate(results, 1):
+        if r.wow_change is None:
+            wow = "[dim]—[/dim]"
+        elif r.wow_change >= 0:
+            wow = f"[green]+{r.wow_change:,.0f}%[/green]"
+        else:
+            wow = f"[red]{r.wow_change:,.0f}%[/red]"
+        tbl.add_row(
+            str(rank),
+            _truncate(r.query, 26),
+            f"{r.current_value:.0f}",
+            f"{r.avg_value:.0f}",
+            f"[bold]{r.zscore:.1f}[/bold]" if r.breakout else f"{r.zscore:.1f}",
+            wow,
+            "[bold green]BREAKOUT[/bold green]" if r.breakout else "",
+        )
+    console.print(tbl)
+
+    console.print()
+    extra = f"  ·  {missing:,} without data" if missing else ""
+    console.print(f"  [dim]{scanned:,} series scanned{extra}[/dim]")
+    console.print()
+    console.print(Rule(style="green dim"))
+    console.print()
+
+
+def render_correlations(
+    timeframe: str,
+    geo: str,
+    results: dict[str, list[Correlation]],
+    terms: int,
+    missing: int,
+    max_lag: int,
+) -> None:
+    """Render the most similar terms for each query, grouped by query."""
+    lag_note = f"  │  lags ±{max_lag}" if max_lag else ""
+    console.print()
+    console.print(
+        Rule(
+            f"[bold green]CORRELATE[/bold green]  [dim]{fmt_timeframe(timeframe)}  │  {fmt_geo(geo)}{lag_note}[/dim]",
+            style="green dim",
+        )
+    )
+    console.print()
+
+    tbl = _base_table()
+    tbl.add_column("Query",   width=24, no_wrap=True)
+    tbl.add_column("Similar", width=24, no_wrap=True)
+    tbl.add_column("r",       width=6,  justify="right", no_wrap=True)
+    if max_lag:
+        tbl.add_column("Lag", width=4, justify="right", no_wrap=True)
+
+    for query, similar in results.items():
+        for i, c in enumerate(similar):
+            color = "green" if c.corr >= 0.7 else "red" if c.corr < 0 else ""
+            row = [
+                f"[bold]{_truncate(query, 24)}[/bold]" if i == 0 else "",
+                _truncate(c.other, 24),
+                f"[{color}]{c.corr:.2f}[/{color}]" if color else f"{c.corr:.2f}",
+            ]
+            if max_lag:
+                row.append(f"{c.lag:+d}" if c.lag else "[dim]0[/dim]")
+            tbl.add_row(*row, end_section=i == len(similar) - 1)
+    console.print(tbl)
+
+    console.print()
+    extra = f"  ·  {missing:,} without data" if missing else ""
+    console.print(f"  [dim]{terms:,} series compared{extra}[/dim]")
+    if max_lag:
+        console.print("  [dim]* Lag > 0: the similar term follows the query by that many points[/dim]")
+    console.print()
+    console.print(Rule(style="green dim"))
+    console.print()
+
+
+def render_warm_report(report: dict) -> None:
+    """Render the coverage summary of a cache warm run."""
+    total = report["jobs"]
+    pct = 100.0 * report["fresh_after"] / total if total else 100.0
+
+    console.print()
+    console.print(
+        Rule(
+            f"[bold green]CACHE WARM[/bold green]  [dim]{fmt_today()}  │  {report['elapsed_s']}s[/dim]",
+            style="green dim",
+        )
+    )
+    console.print()
+
+    tbl = _base_table()
+    tbl.add_column("Metric",            width=20, no_wrap=True)
+    tbl.add_column("Value", justify="right", width=10, no_wrap=True)
+    tbl.add_row("Watchlist entries", str(total))
+    tbl.add_row("Already fresh",     str(report["fresh_before"]))
+    tbl.add_row("Refreshed",         f"[green]{report['refreshed']}[/green]")
+    tbl.add_row("Failed",            f"[red]{len(report['failed'])}[/red]" if report["failed"] else "0")
+    tbl.add_row("Coverage",          f"[bold]{pct:.1f}%[/bold]")
+    console.print(tbl)
+
+    for f in report["failed"][:10]:
+        console.print(f"  [red]✗[/red] {_truncate(f['job'], 40)}  [dim]{_truncate(f['error'], 60)}[/dim]")
+
+    if report.get("proxies"):
+        render_proxy_stats(report["proxies"], rule=False)
+
+    console.print()
+    console.print(Rule(style="green dim"))
+    console.print()
+
+
+def render_cache_stats(data: dict) -> None:
+    """Render disk cache totals and the per-endpoint age histogram."""
+    ratio = "—" if data["hit_ratio"] is None else f"{data['hit_ratio'] * 100:.1f}%"
+
+    console.print()
+    console.print(
+        Rule(
+            f"[bold green]CACHE[/bold green]  [dim]{data['dir']}  │  TTL {data['ttl']}s[/dim]",
+            style="green dim",
+        )
+    )
+    console.print()
+    console.print(
+        f"  Entries: [bold]{data['entries']:,}[/bold]   "
+        f"Size: [bold]{_fmt_bytes(data['bytes'])}[/bold] [dim]/ {_fmt_bytes(data['max_bytes'])}[/dim]   "
+        f"Expired: [bold]{data['expired']:,}[/bold]"
+    )
+    console.print(
+        f"  Hit ratio: [bold]{ratio}[/bold] [dim]({data['hits']:,} / {data['hits'] + data['misses']:,})[/dim]"
+    )
+    console.print()
+
+    if data["endpoints"]:
+        buckets = list(next(iter(data["endpoints"].values()))["ages"])
+        tbl = _base_table()
+        tbl.add_column("Endpoint", width=8, no_wrap=True)
+        tbl.add_column("Entries",  width=8, justify="right", no_wrap=True)
+        tbl.add_column("Size",     width=8, justify="right", no_wrap=True)
+        for b in buckets:
+            tbl.add_column(b, style="dim", width=5, justify="right", no_wrap=True)
+        for name, ep in sorted(data["endpoints"].items()):
+            tbl.add_row(
+                name,
+                f"{ep['entries']:,}",
+                _fmt_bytes(ep["bytes"]),
+                *[_fmt_count(ep["ages"][b]) for b in buckets],
+            )
+        console.print(tbl)
+
+    console.print()
+    console.print(Rule(style="green dim"))
+    console.print()
+
+
+def render_cache_maintenance(label: str, result: dict) -> None:
+    """Render the summary of a prune or verify run."""
+    suffix = "  [dim](dry run)[/dim]" if result.get("dry_run") else ""
+    console.print()
+    console.print(Rule(f"[bold green]{label}[/bold green]{suffix}", style="green dim"))
+    console.print()
+
+    tbl = _base_table()
+    tbl.add_column("Metric", width=16, no_wrap=True)
+    tbl.add_column("Value",  width=12, justify="right", no_wrap=True)
+    for k, v in result.items():
+        if k == "dry_run":
+            continue
+        val = _fmt_bytes(v) if k.endswith("bytes") else f"{v:,}"
+        tbl.add_row(k.replace("_", " ").capitalize(), val)
+    console.print(tbl)
+
+    console.print()
+    console.print(Rule(style="green dim"))
+    console.print()
+
+
+def render_queue_progress(data: dict) -> None:
+    """Render job counts by state, throughput and ETA of the worker queue."""
+    total = data["total"]
+    pct = 100.0 * data["done"] / total if total else 0.0
+    eta = "—" if data["eta_s"] is None else f"{data['eta_s'] // 60}m {data['eta_s'] % 60}s"
+
+    console.print()
+    console.print(
+        Rule(
+            f"[bold green]QUEUE[/bold green]  [dim]{data['queue']}  │  {data['workers']} active workers[/dim]",
+            style="green dim",
+        )
+    )
+    console.print()
+    console.print(
+        f"  Done: [bold]{data['done']:,}[/bold] / {total:,} [dim]({pct:.1f}%)[/dim]   "
+        f"Pending: [bold]{data['pending']:,}[/bold]   Running: [bold]{data['running']:,}[/bold]   "
+        f"Failed: [bold]{data['failed']:,}[/bold]"
+    )
+    console.print(f"  Throughput: [bold]{data['per_min']}[/bold] jobs/min   ETA: [bold]{eta}[/bold]")
+
+    for f in data["errors"]:
+        console.print(f"  [red]✗[/red] {_truncate(f['job'], 40)}  [dim]{_truncate(f['error'] or '', 60)}[/dim]")
+
+    console.print()
+    console.print(Rule(style="green dim"))
+    console.print()
+
+
+def render_proxy_stats(stats: list[dict], rule: bool = True) -> None:
+    """Render per-proxy request counts, 429 rate, latency and quarantine state."""
+    if rule:
+        console.print()
+        console.print(Rule("[bold green]PROXIES[/bold green]", style="green dim"))
+    console.print()
+
+    tbl = _base_table()
+    tbl.add_column("Proxy",     width=30, no_wrap=True)
+    tbl.add_column("Requests",  width=8,  justify="right", no_wrap=True)
+    tbl.add_column("Errors",    width=6,  justify="right", no_wrap=True)
+    tbl.add_column("429 rate",  width=8,  justify="right", no_wrap=True)
+    tbl.add_column("Latency",   width=8,  justify="right", no_wrap=True)
+    tbl.add_column("Status",    width=16, no_wrap=True)
+    for p in stats:
+        status = (
+            f"[red]quarantined {p['quarantined_s']}s[/red]" if p["quarantined_s"]
+            else "[green]healthy[/green]"
+        )
+        tbl.add_row(
+            _truncate(p["proxy"], 30),
+            f"{p['requests']:,}",
+            f"{p['errors']:,}",
+            f"{p['throttle_rate'] * 100:.0f}%",
+            f"{p['latency_ms']} ms",
+            status,
+        )
+    console.print(tbl)
+
+    if rule:
+        console.print()
+        console.print(Rule(style="green dim"))
+        console.print()
+
+
+def _fmt_bytes(n: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+def _fmt_count(n: int) -> str:
+    """Thousands separators, abbreviated past four digits to fit a 5-wide column."""
+    if n < 10_000:
+        return f"{n:,}"
+    if n < 1_000_000:
+        return f"{n // 1000}k"
+    return f"{n / 1_000_000:.1f}M"
+
+
 def _truncate(text: str, width: int) -> str:
     if len(text) <= width:
         return text
@@ -4,6 +4,13 @@ from trends_cli.commands.search import search
 from trends_cli.commands.compare import compare
 from trends_cli.commands.related import related
 from trends_cli.commands.trending import trending
+from trends_cli.commands.scan import scan
+from trends_cli.commands.dashboard import dashboard
+from trends_cli.commands.correlate import correlate
+from trends_cli.commands.proxies import proxies
+from trends_cli.commands.worker import worker
+from trends_cli.commands.cache import app as cache_app
+from trends_cli.commands.queue import app as queue_app
 
 app = typer.Typer(
     name="trends",
@@ -16,6 +23,13 @@ app.command("search",   help="Plot interest over time for a search term")(search
 app.command("compare",  help="Compare up to 5 search terms on one chart")(compare)
 app.command("related",  help="Related queries and topics for a search term")(related)
 app.command("trending", help="Today's trending searches")(trending)
+app.command("scan",     help="Rank many terms by spike z-score and week-over-week change")(scan)
+app.command("dashboard", help="Grid of small charts or sparklines for many terms")(dashboard)
+app.command("correlate", help="Most similar terms by correlation of interest over time")(correlate)
+app.command("proxies",  help="Probe egress proxies and show per-proxy health")(proxies)
+app.command("worker",   help="Run fetch workers against the shared job queue")(worker)
+app.add_typer(cache_app, name="cache", help="Manage the local response cache")
+app.add_typer(queue_app, name="queue", help="Enqueue fetch jobs and track worker progress")
 
 
 if __name__ == "__main__":
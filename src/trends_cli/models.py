@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class DataPoint:
     date: str   # "YYYY-MM-DD"
     value: int  # 0–100
@@ -18,6 +18,7 @@ class TrendSeries:
     peak_date: str = ""
     current_value: int = 0
     avg_value: float = 0.0
+    derived_from: str = ""  # source timeframe when sliced from cached data, else ""
 
 
 @dataclass
@@ -31,3 +32,22 @@ class TrendingSearch:
     rank: int
     title: str
     traffic: str = ""
+
+
+@dataclass
+class ScanResult:
+    query: str
+    current_value: float
+    avg_value: float
+    peak_value: float
+    zscore: float
+    wow_change: float | None  # percent; None when there is not enough history
+    breakout: bool
+
+
+@dataclass
+class Correlation:
+    query: str
+    other: str
+    corr: float  # Pearson r at the best lag, -1–1
+    lag: int     # points; > 0 means `other` follows `query`